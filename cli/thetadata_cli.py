@@ -1,95 +1,111 @@
 """
+Install the package (`pip install -e .`) to get the `thetadata` command, or run
+`python -m cli.thetadata_cli` from the repository root.
+
 Example usage commands:
 
 Stocks Historical Data:
 Get end-of-day report:
-   python main.py stocks historical eod-report AAPL 20240101 20240131
+   thetadata stocks historical eod-report AAPL 20240101 20240131
 
 Get quotes:
-   python main.py stocks historical quotes MSFT 20240101 20240131 --interval 3600000
+   thetadata stocks historical quotes MSFT 20240101 20240131 --interval 3600000
+
+Save as Parquet instead of CSV (requires pyarrow):
+   thetadata --format parquet stocks historical trades AAPL 20240101 20240131
+
+Run several commands in one process, one per line of a file (or - for stdin):
+   thetadata batch commands.txt
 
 Stocks Snapshot Data:
 Get real-time quotes:
-   python main.py stocks snapshot quotes AAPL
+   thetadata stocks snapshot quotes AAPL
 
 Get real-time OHLC:
-   python main.py stocks snapshot ohlc NVDA
+   thetadata stocks snapshot ohlc NVDA
 
 Get real-time trades:
-   python main.py stocks snapshot trades TSLA
+   thetadata stocks snapshot trades TSLA
 
 Options Data:
 Historical:
 Get historical EOD report:
-   python main.py options historical eod-report AAPL 20240119 170000 C 20240101 20240131
+   thetadata options historical eod-report AAPL 20240119 170000 C 20240101 20240131
 
 Get historical quotes:
-   python main.py options historical quotes AAPL 20240119 170000 C 20240101 20240131
+   thetadata options historical quotes AAPL 20240119 170000 C 20240101 20240131
 
 Get historical trades:
-   python main.py options historical trades AAPL 20240119 170000 C 20240101 20240131
+   thetadata options historical trades AAPL 20240119 170000 C 20240101 20240131
 
 Get historical trade quote:
-   python main.py options historical trade-quote AAPL 20240119 170000 C 20240101 20240131
+   thetadata options historical trade-quote AAPL 20240119 170000 C 20240101 20240131
 
 Get historical Greeks:
-   python main.py options historical greeks AAPL 20240119 170000 C 20240101 20240131
+   thetadata options historical greeks AAPL 20240119 170000 C 20240101 20240131
 
 Get historical third-order Greeks:
-   python main.py options historical greeks-third-order AAPL 20240119 170000 C 20240101 20240131
+   thetadata options historical greeks-third-order AAPL 20240119 170000 C 20240101 20240131
 
 Get historical trade Greeks:
-   python main.py options historical trade-greeks AAPL 20240119 170000 C 20240101 20240131
+   thetadata options historical trade-greeks AAPL 20240119 170000 C 20240101 20240131
 
 Get historical trade Greeks third order:
-   python main.py options historical trade-greeks-third-order AAPL 20240119 170000 C 20240101 20240131
+   thetadata options historical trade-greeks-third-order AAPL 20240119 170000 C 20240101 20240131
 
 Bulk:
 Get bulk EOD:
-   python main.py options bulk eod AAPL 20240119 20240101 20240131
+   thetadata options bulk eod AAPL 20240119 20240101 20240131
 
 Get bulk OHLC:
-   python main.py options bulk ohlc AAPL 20240119 20240101 20240131
+   thetadata options bulk ohlc AAPL 20240119 20240101 20240131
 
 Get bulk trade:
-   python main.py options bulk trade AAPL 20240119 20240101 20240131
+   thetadata options bulk trade AAPL 20240119 20240101 20240131
 
 Get bulk trade quote:
-   python main.py options bulk trade-quote AAPL 20240119 20240101 20240131
+   thetadata options bulk trade-quote AAPL 20240119 20240101 20240131
 
 Get bulk trade Greeks:
-   python main.py options bulk trade-greeks AAPL 20240119 20240101 20240131
+   thetadata options bulk trade-greeks AAPL 20240119 20240101 20240131
 
 Snapshot:
 Get quote snapshot:
-   python main.py options snapshot quote AAPL 20240119 170000 C
+   thetadata options snapshot quote AAPL 20240119 170000 C
 
 Get OHLC snapshot:
-   python main.py options snapshot ohlc AAPL 20240119 C 170000
+   thetadata options snapshot ohlc AAPL 20240119 C 170000
 
 Get bulk quote snapshot:
-   python main.py options snapshot bulk-quote AAPL 20240119
+   thetadata options snapshot bulk-quote AAPL 20240119
 
 Get bulk OHLC snapshot:
-   python main.py options snapshot bulk-ohlc AAPL 20240119
+   thetadata options snapshot bulk-ohlc AAPL 20240119
 
 Get bulk open interest snapshot:
-   python main.py options snapshot bulk-open-interest AAPL 20240119
+   thetadata options snapshot bulk-open-interest AAPL 20240119
 """
 
 import typer
 import sys
-import os
-from functools import wraps
-from rich.progress import Progress, SpinnerColumn, TextColumn
+import threading
+import contextlib
+import functools
+import importlib.util
+import inspect
+import shlex
+from enum import Enum
+from typing import TYPE_CHECKING, Annotated, Callable, Iterator, Optional, List
 
-# Add the parent directory to sys.path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.utils import is_valid_date_format
 
-from src.stocks_historical import ThetaDataStocksHistorical
-from src.stocks import ThetaDataStocksSnapshot
-from src.options import ThetaDataOptions
-from typing import Optional, List
+if TYPE_CHECKING:
+    import requests
+
+    from src.base import ThetaDataBase
+    from src.options import ThetaDataOptions
+    from src.stocks import ThetaDataStocksSnapshot
+    from src.stocks_historical import ThetaDataStocksHistorical
 
 app = typer.Typer(no_args_is_help=True)
 stocks_app = typer.Typer(no_args_is_help=True)
@@ -107,336 +123,480 @@ options_app.add_typer(options_historical_app, name="historical")
 options_app.add_typer(options_bulk_app, name="bulk")
 options_app.add_typer(options_snapshot_app, name="snapshot")
 
-historical_data = ThetaDataStocksHistorical()
-snapshot_data = ThetaDataStocksSnapshot()
-options_data = ThetaDataOptions()
-
-
-def with_spinner(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            transient=True,
-        ) as progress:
-            task = progress.add_task(description="Loading data...", total=None)
-            result = func(*args, **kwargs)
-            progress.update(task, completed=True)
-        return result
-
-    return wrapper
-
-
-# Historical commands
-@historical_app.command(name="eod-report")
-@with_spinner
-def eod_report(symbol: str, start_date: str, end_date: str):
-    """Get end-of-day report for a given symbol and date range."""
-    result = historical_data.get_eod_report(
-        symbol, start_date, end_date, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
-
-
-@historical_app.command(name="quotes")
-@with_spinner
-def historical_quotes(
-    symbol: str,
-    start_date: str,
-    end_date: str,
-    interval: str = "900000",
-):
-    """Get historical quotes for a given symbol and date range."""
-    result = historical_data.get_quotes(
-        symbol, start_date, end_date, interval, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
-
-
-@historical_app.command(name="ohlc")
-@with_spinner
-def historical_ohlc(
-    symbol: str,
-    start_date: str,
-    end_date: str,
-    interval: str = "900000",
-):
-    """Get historical OHLC data for a given symbol and date range."""
-    result = historical_data.get_ohlc(
-        symbol, start_date, end_date, interval, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
 
+# Seconds a command may run before the spinner is shown.
+SPINNER_DELAY = 0.2
 
-@historical_app.command(name="trades")
-@with_spinner
-def historical_trades(symbol: str, start_date: str, end_date: str):
-    """Get historical trade data for a given symbol and date range."""
-    result = historical_data.get_trades(symbol, start_date, end_date, write_csv=True)
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
 
+class OutputFormat(str, Enum):
+    csv = "csv"
+    parquet = "parquet"
 
-@historical_app.command(name="trade-quote")
-@with_spinner
-def trade_quote(symbol: str, start_date: str, end_date: str):
-    """Get historical trade and quote data for a given symbol and date range."""
-    result = historical_data.get_trade_quote(
-        symbol, start_date, end_date, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
 
+# Set by the --format and --no-cache options on every invocation, including
+# each line of a batch, and applied to the client before each call.
+_settings = {"output_format": OutputFormat.csv, "use_cache": True}
 
-@historical_app.command(name="splits")
-@with_spinner
-def splits(symbol: str, start_date: str, end_date: str):
-    """Get stock split data for a given symbol and date range."""
-    result = historical_data.get_splits(symbol, start_date, end_date, write_csv=True)
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
 
+@app.callback()
+def main(
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option("--format", help="File format for saved data."),
+    ] = OutputFormat.csv,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Always fetch fresh data from the terminal."),
+    ] = False,
+) -> None:
+    """Download ThetaData market data to local files."""
+    if (
+        output_format is OutputFormat.parquet
+        and importlib.util.find_spec("pyarrow") is None
+    ):
+        raise typer.BadParameter(
+            "parquet output requires pyarrow", param_hint="--format"
+        )
+    _settings["output_format"] = output_format
+    _settings["use_cache"] = not no_cache
 
-@historical_app.command(name="dividends")
-@with_spinner
-def dividends(symbol: str, start_date: str, end_date: str):
-    """Get dividend data for a given symbol and date range."""
-    result = historical_data.get_dividends(symbol, start_date, end_date, write_csv=True)
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
 
+# The data clients pull in pandas and requests, so they are imported and
+# constructed on first use. This keeps `--help` and argument errors fast.
+@functools.cache
+def _session() -> "requests.Session":
+    from src.base import create_session
 
-# Snapshot commands
-@snapshot_app.command(name="quotes")
-@with_spinner
-def snapshot_quotes(symbol: str, venue: Optional[str] = None):
-    """Get real-time quotes for a given symbol."""
-    result = snapshot_data.get_quotes(symbol, venue, write_csv=True)
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
+    # One keep-alive connection pool shared by every client in this process.
+    return create_session()
 
 
-@snapshot_app.command(name="bulk-quotes")
-@with_spinner
-def bulk_quotes(symbols: List[str], venue: Optional[str] = None):
-    """Get real-time quotes for multiple symbols."""
-    result = snapshot_data.get_bulk_quotes(symbols, venue, write_csv=True)
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
+@functools.cache
+def _historical() -> "ThetaDataStocksHistorical":
+    from src.stocks_historical import ThetaDataStocksHistorical
 
+    return ThetaDataStocksHistorical(session=_session())
 
-@snapshot_app.command(name="ohlc")
-@with_spinner
-def snapshot_ohlc(symbol: str):
-    """Get real-time OHLC data for a given symbol."""
-    result = snapshot_data.get_ohlc(symbol, write_csv=True)
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
 
+@functools.cache
+def _snapshot() -> "ThetaDataStocksSnapshot":
+    from src.stocks import ThetaDataStocksSnapshot
 
-@snapshot_app.command(name="bulk-ohlc")
-@with_spinner
-def bulk_ohlc(symbols: List[str]):
-    """Get real-time OHLC data for multiple symbols."""
-    result = snapshot_data.get_bulk_ohlc(symbols, write_csv=True)
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
+    return ThetaDataStocksSnapshot(session=_session())
 
 
-@snapshot_app.command(name="trades")
-@with_spinner
-def snapshot_trades(symbol: str):
-    """Get real-time trade data for a given symbol."""
-    result = snapshot_data.get_trades(symbol, write_csv=True)
-    if result is not None:
+@functools.cache
+def _options() -> "ThetaDataOptions":
+    from src.options import ThetaDataOptions
+
+    return ThetaDataOptions(session=_session())
+
+
+@functools.cache
+def _spinner_columns() -> tuple:
+    from rich.progress import SpinnerColumn, TextColumn
+
+    return SpinnerColumn(), TextColumn("[progress.description]{task.description}")
+
+
+@contextlib.contextmanager
+def _spinner() -> Iterator[None]:
+    """Show a transient spinner while a command waits for data."""
+    # Nothing renders the spinner when output is piped or redirected, so
+    # skip rich and its refresh thread entirely.
+    if not sys.stdout.isatty():
+        yield
+        return
+
+    from rich.progress import Progress
+
+    # A spinner reads fine at 4 frames per second; rich defaults to 10.
+    progress = Progress(*_spinner_columns(), transient=True, refresh_per_second=4)
+    progress.add_task(description="Loading data...", total=None)
+
+    # Fast responses (cache hits, immediate errors) finish before the spinner
+    # would be visible, so only start it once the call has been running a
+    # while.
+    timer = threading.Timer(SPINNER_DELAY, progress.start)
+    timer.start()
+    try:
+        yield
+    finally:
+        timer.cancel()
+        timer.join()
+        progress.stop()
+
+
+def _require(result: object) -> None:
+    """Exit with status 1 if the client returned no data."""
+    if result is None:
+        typer.secho("Failed to retrieve data", err=True, fg="red")
+        raise typer.Exit(code=1)
+
+
+def _check_date(value: str) -> str:
+    """Reject malformed dates before any request is sent."""
+    if not is_valid_date_format(value):
+        raise typer.BadParameter(f"{value!r} is not a date formatted as YYYYMMDD")
+    return value
+
+
+# Date range arguments shared by every historical command.
+DateArg = Annotated[str, typer.Argument(callback=_check_date)]
+
+
+def _canonical(symbols: List[str]) -> tuple:
+    """
+    Normalize a symbol list to sorted, unique, upper-case tickers.
+
+    The same set of symbols then always produces the same request, cache key
+    and output file name, whatever order or case they were typed in.
+    """
+    return tuple(sorted({symbol.upper() for symbol in symbols}))
+
+
+def _make_command(
+    client: Callable[[], "ThetaDataBase"],
+    method_name: str,
+    arguments: list,
+    options: list,
+    help_text: str,
+) -> Callable[..., None]:
+    """
+    Build a Typer command that forwards its arguments to a client method.
+
+    Args:
+        client: Zero-argument factory returning the data client.
+        method_name (str): Name of the client method to call.
+        arguments (list): (name, annotation) pairs for the positional
+            arguments, in order.
+        options (list): (name, annotation, default) triples for the optional
+            parameters.
+        help_text (str): Help text shown by Typer.
+    """
+    params = [
+        inspect.Parameter(
+            name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=annotation
+        )
+        for name, annotation in arguments
+    ]
+    params += [
+        inspect.Parameter(
+            name,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            default=default,
+            annotation=annotation,
+        )
+        for name, annotation, default in options
+    ]
+
+    def command(**kwargs) -> None:
+        if "symbols" in kwargs:
+            kwargs["symbols"] = _canonical(kwargs["symbols"])
+        data_client = client()
+        from src.base import default_cache_dir
+
+        data_client.output_format = _settings["output_format"].value
+        # Responses for closed date ranges are cached so repeated commands skip
+        # the round trip to the Theta Terminal.
+        data_client.cache_dir = default_cache_dir() if _settings["use_cache"] else None
+        with _spinner():
+            result = getattr(data_client, method_name)(**kwargs, write_csv=True)
+        _require(result)
         typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
-
-
-# Options commands
-# Historical
-@options_historical_app.command(name="eod-report")
-@with_spinner
-def historical_eod_report(
-    root: str, exp: str, strike: int, right: str, start_date: str, end_date: str
-):
-    """Get historical end-of-day report for a specific option contract."""
-    result = options_data.get_historical_eod_report(
-        root, exp, strike, right, start_date, end_date, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
-
-
-@options_historical_app.command(name="quotes")
-@with_spinner
-def historical_option_quotes(
-    root: str,
-    exp: str,
-    strike: int,
-    right: str,
-    start_date: str,
-    end_date: str,
-    ivl: int = 0,
-):
-    """Get historical NBBO quotes for a specific option."""
-    result = options_data.get_historical_quotes(
-        root, exp, strike, right, start_date, end_date, ivl, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
-
-
-@options_historical_app.command(name="trades")
-@with_spinner
-def historical_option_trades(
-    root: str, exp: str, strike: int, right: str, start_date: str, end_date: str
-):
-    """Get historical trades for a specific option."""
-    result = options_data.get_historical_trades(
-        root, exp, strike, right, start_date, end_date, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
-
-
-@options_historical_app.command(name="trade-quote")
-@with_spinner
-def historical_option_trade_quote(
-    root: str, exp: str, strike: int, right: str, start_date: str, end_date: str
-):
-    """Get historical trade and quote data for a specific option."""
-    result = options_data.get_historical_trade_quote(
-        root, exp, strike, right, start_date, end_date, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
-
-
-@options_historical_app.command(name="greeks")
-@with_spinner
-def historical_greeks(
-    root: str,
-    exp: str,
-    strike: int,
-    right: str,
-    start_date: str,
-    end_date: str,
-    ivl: int = 0,
-):
-    """Get historical Greeks data for a specific option."""
-    result = options_data.get_historical_greeks(
-        root, exp, strike, right, start_date, end_date, ivl, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
-
-
-@options_historical_app.command(name="greeks-third-order")
-@with_spinner
-def historical_greeks_third_order(
-    root: str,
-    exp: str,
-    strike: int,
-    right: str,
-    start_date: str,
-    end_date: str,
-    ivl: int = 0,
-):
-    """Get historical third-order Greeks data for a specific option."""
-    result = options_data.get_historical_greeks_third_order(
-        root, exp, strike, right, start_date, end_date, ivl, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
-
-
-@options_historical_app.command(name="trade-greeks")
-@with_spinner
-def historical_trade_greeks(
-    root: str, exp: str, strike: int, right: str, start_date: str, end_date: str
-):
-    """Get historical trade Greeks data for a specific option."""
-    result = options_data.get_historical_trade_greeks(
-        root, exp, strike, right, start_date, end_date, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
-
-
-@options_historical_app.command(name="trade-greeks-third-order")
-@with_spinner
-def historical_trade_greeks_third_order(
-    root: str, exp: str, strike: int, right: str, start_date: str, end_date: str
-):
-    """Get historical trade Greeks third order data for a specific option."""
-    result = options_data.get_historical_trade_greeks_third_order(
-        root, exp, strike, right, start_date, end_date, write_csv=True
-    )
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
-
 
-# Bulk
-@options_bulk_app.command(name="eod")
-@with_spinner
-def bulk_eod(root: str, exp: str, start_date: str, end_date: str):
-    """Get bulk end-of-day data for options with the same root and expiration."""
-    result = options_data.get_bulk_eod(root, exp, start_date, end_date, write_csv=True)
-    if result is not None:
-        typer.echo("Data retrieved successfully")
-    else:
-        typer.echo("Failed to retrieve data")
+    command.__name__ = method_name
+    command.__doc__ = help_text
+    command.__signature__ = inspect.Signature(params)
+    command.__annotations__ = {param.name: param.annotation for param in params}
+    return command
+
+
+# Positional arguments shared by several commands
+SYMBOL_RANGE = [("symbol", str), ("start_date", DateArg), ("end_date", DateArg)]
+CONTRACT_RANGE = [
+    ("root", str),
+    ("exp", str),
+    ("strike", int),
+    ("right", str),
+    ("start_date", DateArg),
+    ("end_date", DateArg),
+]
+EXPIRATION_RANGE = [
+    ("root", str),
+    ("exp", str),
+    ("start_date", DateArg),
+    ("end_date", DateArg),
+]
+
+# Optional parameters shared by several commands
+INTERVAL = [("interval", str, "900000")]
+IVL = [("ivl", int, 0)]
+VENUE = [("venue", Optional[str], None)]
+
+# (Typer app, command name, client factory, client method, arguments, options, help)
+COMMANDS = [
+    # Stocks historical
+    (
+        historical_app,
+        "eod-report",
+        _historical,
+        "get_eod_report",
+        SYMBOL_RANGE,
+        [],
+        "Get end-of-day report for a given symbol and date range.",
+    ),
+    (
+        historical_app,
+        "quotes",
+        _historical,
+        "get_quotes",
+        SYMBOL_RANGE,
+        INTERVAL,
+        "Get historical quotes for a given symbol and date range.",
+    ),
+    (
+        historical_app,
+        "ohlc",
+        _historical,
+        "get_ohlc",
+        SYMBOL_RANGE,
+        INTERVAL,
+        "Get historical OHLC data for a given symbol and date range.",
+    ),
+    (
+        historical_app,
+        "trades",
+        _historical,
+        "get_trades",
+        SYMBOL_RANGE,
+        [],
+        "Get historical trade data for a given symbol and date range.",
+    ),
+    (
+        historical_app,
+        "trade-quote",
+        _historical,
+        "get_trade_quote",
+        SYMBOL_RANGE,
+        [],
+        "Get historical trade and quote data for a given symbol and date range.",
+    ),
+    (
+        historical_app,
+        "splits",
+        _historical,
+        "get_splits",
+        SYMBOL_RANGE,
+        [],
+        "Get stock split data for a given symbol and date range.",
+    ),
+    (
+        historical_app,
+        "dividends",
+        _historical,
+        "get_dividends",
+        SYMBOL_RANGE,
+        [],
+        "Get dividend data for a given symbol and date range.",
+    ),
+    # Stocks snapshot
+    (
+        snapshot_app,
+        "quotes",
+        _snapshot,
+        "get_quotes",
+        [("symbol", str)],
+        VENUE,
+        "Get real-time quotes for a given symbol.",
+    ),
+    (
+        snapshot_app,
+        "bulk-quotes",
+        _snapshot,
+        "get_bulk_quotes",
+        [("symbols", List[str])],
+        VENUE,
+        "Get real-time quotes for multiple symbols.",
+    ),
+    (
+        snapshot_app,
+        "ohlc",
+        _snapshot,
+        "get_ohlc",
+        [("symbol", str)],
+        [],
+        "Get real-time OHLC data for a given symbol.",
+    ),
+    (
+        snapshot_app,
+        "bulk-ohlc",
+        _snapshot,
+        "get_bulk_ohlc",
+        [("symbols", List[str])],
+        [],
+        "Get real-time OHLC data for multiple symbols.",
+    ),
+    (
+        snapshot_app,
+        "trades",
+        _snapshot,
+        "get_trades",
+        [("symbol", str)],
+        [],
+        "Get real-time trade data for a given symbol.",
+    ),
+    # Options historical
+    (
+        options_historical_app,
+        "eod-report",
+        _options,
+        "get_historical_eod_report",
+        CONTRACT_RANGE,
+        [],
+        "Get historical end-of-day report for a specific option contract.",
+    ),
+    (
+        options_historical_app,
+        "quotes",
+        _options,
+        "get_historical_quotes",
+        CONTRACT_RANGE,
+        IVL,
+        "Get historical NBBO quotes for a specific option.",
+    ),
+    (
+        options_historical_app,
+        "trades",
+        _options,
+        "get_historical_trades",
+        CONTRACT_RANGE,
+        [],
+        "Get historical trades for a specific option.",
+    ),
+    (
+        options_historical_app,
+        "trade-quote",
+        _options,
+        "get_historical_trade_quote",
+        CONTRACT_RANGE,
+        [],
+        "Get historical trade and quote data for a specific option.",
+    ),
+    (
+        options_historical_app,
+        "greeks",
+        _options,
+        "get_historical_greeks",
+        CONTRACT_RANGE,
+        IVL,
+        "Get historical Greeks data for a specific option.",
+    ),
+    (
+        options_historical_app,
+        "greeks-third-order",
+        _options,
+        "get_historical_greeks_third_order",
+        CONTRACT_RANGE,
+        IVL,
+        "Get historical third-order Greeks data for a specific option.",
+    ),
+    (
+        options_historical_app,
+        "trade-greeks",
+        _options,
+        "get_historical_trade_greeks",
+        CONTRACT_RANGE,
+        [],
+        "Get historical trade Greeks data for a specific option.",
+    ),
+    (
+        options_historical_app,
+        "trade-greeks-third-order",
+        _options,
+        "get_historical_trade_greeks_third_order",
+        CONTRACT_RANGE,
+        [],
+        "Get historical trade Greeks third order data for a specific option.",
+    ),
+    # Options bulk
+    (
+        options_bulk_app,
+        "eod",
+        _options,
+        "get_bulk_eod",
+        EXPIRATION_RANGE,
+        [],
+        "Get bulk end-of-day data for options with the same root and expiration.",
+    ),
+    (
+        options_app,
+        "bulk-ohlc",
+        _options,
+        "get_bulk_ohlc",
+        EXPIRATION_RANGE,
+        IVL,
+        "Get bulk OHLC data for options with the same root and expiration.",
+    ),
+]
+
+for command_app, name, client, method_name, arguments, options, help_text in COMMANDS:
+    command_app.command(name=name)(
+        _make_command(client, method_name, arguments, options, help_text)
+    )
 
 
-@options_app.command(name="bulk-ohlc")
-@with_spinner
-def bulk_option_ohlc(root: str, exp: str, start_date: str, end_date: str, ivl: int = 0):
-    """Get bulk OHLC data for options with the same root and expiration."""
-    options_data.get_bulk_ohlc(root, exp, start_date, end_date, ivl, write_csv=True)
+def _command_name(args: List[str]) -> Optional[str]:
+    """Return the first command word of a batch line, skipping global options."""
+    i = 0
+    while i < len(args) and args[i].startswith("-"):
+        i += 2 if args[i] == "--format" else 1
+    return args[i] if i < len(args) else None
+
+
+@app.command()
+def batch(
+    file: Annotated[
+        typer.FileText,
+        typer.Argument(help="File with one command per line, or - for stdin."),
+    ],
+) -> None:
+    """
+    Run several commands in one process.
+
+    Each line holds the arguments of one command, e.g.
+    `stocks historical eod-report AAPL 20240101 20240131`. The commands share
+    the same clients, HTTP connections and cache, so only the first one pays
+    the startup cost. Blank lines and text after # are ignored.
+    """
+    output_format = _settings["output_format"].value
+    cache_args = [] if _settings["use_cache"] else ["--no-cache"]
+    failures = 0
+    for number, line in enumerate(file, 1):
+        args = shlex.split(line, comments=True)
+        if not args:
+            continue
+        if _command_name(args) == "batch":
+            typer.secho(f"line {number}: batch cannot be nested", err=True, fg="red")
+            failures += 1
+            continue
+        # Lines inherit the batch's --format and --no-cache unless they set
+        # their own.
+        args = ["--format", output_format, *cache_args, *args]
+        try:
+            app(args)
+        except SystemExit as e:
+            # Standalone mode reports errors itself and always exits.
+            if e.code:
+                failures += 1
+        except Exception as e:
+            # A failing line must not stop the rest of the batch.
+            typer.secho(f"line {number}: {e}", err=True, fg="red")
+            failures += 1
+
+    if failures:
+        typer.secho(f"{failures} command(s) failed", err=True, fg="red")
+        raise typer.Exit(code=1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,37 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from src.base import create_session, default_cache_dir
+from src.options import ThetaDataOptions
+
+# The clients log at DEBUG; show their messages on stderr.
+logging.basicConfig(format="%(asctime)s - %(levelname)s - %(message)s")
+
+CACHE_DIR = default_cache_dir()
+
+# One keep-alive connection pool shared by every example client.
+session = create_session()
+
+options_data = ThetaDataOptions(log_level="DEBUG", cache_dir=CACHE_DIR, session=session)
+
+
+def run_concurrently(
+    calls: list[Callable[[], None]], max_workers: int | None = None
+) -> None:
+    """
+    Run example functions side by side and wait for all of them.
+
+    The examples spend nearly all their time waiting on the terminal, so running
+    them together is much faster. Their log and print output interleaves,
+    though; pass max_workers=1 to run them one after another with readable output.
+
+    Args:
+        calls (list[Callable[[], None]]): The example functions to run.
+        max_workers (int | None): The number of examples run at once. Defaults to
+            ThreadPoolExecutor's default.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(call) for call in calls]
+        for future in futures:
+            future.result()
@@ -1,20 +1,15 @@
-import sys
-import os
 from functools import wraps
+from typing import Any, Callable
 from datetime import datetime, timedelta
 
-# Add the parent directory to sys.path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from examples._client import options_data, run_concurrently
 
-from src.options import ThetaDataOptions
 
-options_data = ThetaDataOptions(log_level="DEBUG")
+def example_runner(func: Callable[..., Any]) -> Callable[..., None]:
+    description = func.__name__.replace("_", " ").title()
 
-
-def example_runner(func):
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        description = func.__name__.replace("_", " ").title()
+    def wrapper(*args, **kwargs) -> None:
         result = func(*args, **kwargs)
 
         if result is None:
@@ -23,8 +18,7 @@ def example_runner(func):
             options_data.logger.warning(f"{description} is empty")
         else:
             options_data.logger.info(f"{description} received")
-            print(f"\n{description}:")
-            print(result)
+            print(f"\n{description}:\n{result}")
 
     return wrapper
 
@@ -90,15 +84,15 @@ def nvda_bulk_trade_greeks_example():
 # Toggle example cases
 if __name__ == "__main__":
     run_examples = {
-        "aapl_historical_greeks_example": True,
-        "spy_historical_greeks_second_order_example": True,
-        "tsla_historical_greeks_third_order_example": True,
-        "amzn_historical_trade_greeks_example": True,
-        "msft_historical_trade_greeks_second_order_example": True,
-        "googl_historical_trade_greeks_third_order_example": True,
-        "nvda_bulk_trade_greeks_example": True,
+        aapl_historical_greeks_example: True,
+        spy_historical_greeks_second_order_example: True,
+        tsla_historical_greeks_third_order_example: True,
+        amzn_historical_trade_greeks_example: True,
+        msft_historical_trade_greeks_second_order_example: True,
+        googl_historical_trade_greeks_third_order_example: True,
+        nvda_bulk_trade_greeks_example: True,
     }
 
-    for example, should_run in run_examples.items():
-        if should_run:
-            globals()[example]()
+    run_concurrently(
+        [example for example, should_run in run_examples.items() if should_run]
+    )
@@ -1,19 +1,14 @@
-import sys
-import os
 from functools import wraps
+from typing import Any, Callable
 
-# Add the parent directory to sys.path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from examples._client import options_data, run_concurrently
 
-from src.options import ThetaDataOptions
 
-options_data = ThetaDataOptions(log_level="DEBUG")
+def example_runner(func: Callable[..., Any]) -> Callable[..., None]:
+    description = func.__name__.replace("_", " ").title()
 
-
-def example_runner(func):
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        description = func.__name__.replace("_", " ").title()
+    def wrapper(*args, **kwargs) -> None:
         result = func(*args, **kwargs)
 
         if result is None:
@@ -22,8 +17,7 @@ def example_runner(func):
             options_data.logger.warning(f"{description} is empty")
         else:
             options_data.logger.info(f"{description} received")
-            print(f"\n{description}:")
-            print(result)
+            print(f"\n{description}:\n{result}")
 
     return wrapper
 
@@ -87,16 +81,16 @@ def intc_historical_trade_greeks_second_order_example():
 # Toggle example cases
 if __name__ == "__main__":
     run_examples = {
-        "aapl_historical_trades_example": True,
-        "spy_historical_trade_quote_example": True,
-        "tsla_historical_quotes_example": True,
-        "amzn_historical_ohlc_example": True,
-        "msft_historical_greeks_example": True,
-        "googl_historical_all_greeks_example": True,
-        "nvda_historical_trade_greeks_example": True,
-        "intc_historical_trade_greeks_second_order_example": True,
+        aapl_historical_trades_example: True,
+        spy_historical_trade_quote_example: True,
+        tsla_historical_quotes_example: True,
+        amzn_historical_ohlc_example: True,
+        msft_historical_greeks_example: True,
+        googl_historical_all_greeks_example: True,
+        nvda_historical_trade_greeks_example: True,
+        intc_historical_trade_greeks_second_order_example: True,
     }
 
-    for example, should_run in run_examples.items():
-        if should_run:
-            globals()[example]()
+    run_concurrently(
+        [example for example, should_run in run_examples.items() if should_run]
+    )
@@ -1,16 +1,17 @@
-import sys
-import os
 from functools import wraps
+from typing import Any, Callable
 
-# Add the parent directory to sys.path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+from examples._client import CACHE_DIR, session, run_concurrently
 from src.stocks_historical import ThetaDataStocksHistorical
 
-historical_data = ThetaDataStocksHistorical(log_level="DEBUG")
+historical_data = ThetaDataStocksHistorical(
+    log_level="DEBUG",
+    cache_dir=CACHE_DIR,
+    session=session,
+)
 
 
-def example_runner(func):
+def example_runner(func: Callable[..., Any]) -> Callable[..., None]:
     """
     A decorator that wraps functions to provide consistent logging and output formatting.
 
@@ -30,9 +31,10 @@ def example_runner(func):
         callable: The wrapped function with added logging and output formatting.
     """
 
+    description = func.__name__.replace("_", " ").title()
+
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        description = func.__name__.replace("_", " ").title()
+    def wrapper(*args, **kwargs) -> None:
         result = func(*args, **kwargs)
 
         if result is None:
@@ -41,8 +43,7 @@ def example_runner(func):
             historical_data.logger.warning(f"{description} is empty")
         else:
             historical_data.logger.info(f"{description} received")
-            print(f"\n{description}:")
-            print(result)
+            print(f"\n{description}:\n{result}")
 
     return wrapper
 
@@ -87,15 +88,15 @@ def intel_dividends_example():
 # Toggle example cases
 if __name__ == "__main__":
     run_examples = {
-        "apple_eod_example": True,
-        "microsoft_quotes_example": True,
-        "google_ohlc_example": True,
-        "tesla_trades_example": True,
-        "amazon_trade_quote_example": True,
-        "nvidia_splits_example": True,
-        "intel_dividends_example": True,
+        apple_eod_example: True,
+        microsoft_quotes_example: True,
+        google_ohlc_example: True,
+        tesla_trades_example: True,
+        amazon_trade_quote_example: True,
+        nvidia_splits_example: True,
+        intel_dividends_example: True,
     }
 
-    for example, should_run in run_examples.items():
-        if should_run:
-            globals()[example]()
+    run_concurrently(
+        [example for example, should_run in run_examples.items() if should_run]
+    )
@@ -1,14 +1,12 @@
-import sys
-import os
-
-from stocks_historical_examples import example_runner
-
-# Add the parent directory to sys.path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+from examples._client import CACHE_DIR, session, run_concurrently
+from examples.stocks_historical_examples import example_runner
 from src.stocks import ThetaDataStocksSnapshot
 
-snapshot_data = ThetaDataStocksSnapshot(log_level="INFO", output_dir="./output")
+snapshot_data = ThetaDataStocksSnapshot(
+    output_dir="./output",
+    cache_dir=CACHE_DIR,
+    session=session,
+)
 
 
 @example_runner
@@ -44,14 +42,14 @@ def tesla_trades_example():
 # Toggle example cases
 if __name__ == "__main__":
     run_examples = {
-        "apple_quotes_example": True,
-        "microsoft_quotes_nqb_example": True,
-        "bulk_quotes_example": True,
-        "nvidia_ohlc_example": True,
-        "bulk_ohlc_example": True,
-        "tesla_trades_example": True,
+        apple_quotes_example: True,
+        microsoft_quotes_nqb_example: True,
+        bulk_quotes_example: True,
+        nvidia_ohlc_example: True,
+        bulk_ohlc_example: True,
+        tesla_trades_example: True,
     }
 
-    for example, should_run in run_examples.items():
-        if should_run:
-            globals()[example]()
+    run_concurrently(
+        [example for example, should_run in run_examples.items() if should_run]
+    )
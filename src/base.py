@@ -1,59 +1,936 @@
+import atexit
+import contextlib
+import datetime
+import functools
+import hashlib
+import importlib.util
+import io
+import json
 import logging
 import os
+import queue
+import tempfile
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlencode, urlsplit
+from zoneinfo import ZoneInfo
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to pandas' CSV writer
+    pa = None
+
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the standard json module
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+# Snapshots change constantly, so cached snapshot responses only absorb
+# back-to-back repeats of the same call.
+SNAPSHOT_CACHE_TTL = 5
+
+# Ranges that end today or later are still filling in, so their cached
+# responses are refreshed every few minutes.
+OPEN_RANGE_CACHE_TTL = 300
+
+# Trading dates are exchange dates, so "today" is taken in New York time.
+MARKET_TZ = ZoneInfo("America/New_York")
+
+OUTPUT_FORMATS = ("csv", "parquet")
+
+# Compression codecs for CSV output and the suffix added to the file name.
+CSV_COMPRESSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+BASE_URL = "http://127.0.0.1:25510"
+
+# Environment variable naming the response cache directory used when a client
+# is created without cache_dir.
+CACHE_DIR_ENV = "THETADATA_CACHE_DIR"
+
+# Connections kept open to the terminal by a client's own session. This covers
+# send_many's default worker count with room to spare.
+POOL_MAXSIZE = 16
+
+# Transient failures are retried with exponential backoff (at once, then after
+# about 1s and 2s), waiting for Retry-After instead when the server sends it.
+# Up to 0.25s of random jitter is added so that concurrent requests rejected
+# together do not all retry at the same moment. A refused connection usually
+# means the terminal is not running, so it is only retried once. A read
+# timeout means the terminal is busy with the query, and sending it again only
+# adds to the load, so those are not retried.
+RETRY = Retry(
+    total=3,
+    connect=1,
+    read=0,
+    backoff_factor=0.5,
+    backoff_jitter=0.25,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False,
+)
+
+# (connect, read) timeouts in seconds. The read timeout limits the wait for each
+# chunk of a response, not the whole download, so large requests still finish.
+REQUEST_TIMEOUT = (3.05, 60)
+
+# Frames with more rows than this are serialized to CSV on several threads.
+PARALLEL_CSV_ROWS = 200_000
+# Bytes of a streamed CSV response parsed at a time.
+CSV_BLOCK_SIZE = 4 << 20
+
+# Numeric columns of the API's response formats and the dtype pandas gives
+# them. Responses made up only of these columns are built column by column
+# with np.fromiter, which is several times faster than pandas inferring the
+# types of every row. The dtypes also type empty responses and CSV columns.
+COLUMN_DTYPES = {
+    **dict.fromkeys(
+        [
+            "ms_of_day",
+            "ms_of_day2",
+            "date",
+            "bid_size",
+            "bid_exchange",
+            "bid_condition",
+            "ask_size",
+            "ask_exchange",
+            "ask_condition",
+            "size",
+            "exchange",
+            "condition",
+            "ext_condition1",
+            "ext_condition2",
+            "ext_condition3",
+            "ext_condition4",
+            "condition_flags",
+            "price_flags",
+            "volume_type",
+            "records_back",
+            "sequence",
+            "volume",
+            "count",
+            "open_interest",
+        ],
+        "int64",
+    ),
+    **dict.fromkeys(
+        [
+            "bid",
+            "ask",
+            "midpoint",
+            "price",
+            "open",
+            "high",
+            "low",
+            "close",
+            "underlying_price",
+            "implied_vol",
+            "bid_implied_vol",
+            "mid_implied_vol",
+            "ask_implied_vol",
+            "iv_error",
+            "delta",
+            "gamma",
+            "theta",
+            "vega",
+            "rho",
+            "epsilon",
+            "lambda",
+            "vanna",
+            "charm",
+            "vomma",
+            "veta",
+            "speed",
+            "zomma",
+            "color",
+            "ultima",
+        ],
+        "float64",
+    ),
+}
+
+
+def create_session(
+    base_url: str = BASE_URL, pool_maxsize: int = POOL_MAXSIZE
+) -> requests.Session:
+    """
+    Create an HTTP session set up for the Theta Terminal.
+
+    Args:
+        base_url (str): The address of the terminal. Defaults to BASE_URL.
+        pool_maxsize (int): The number of keep-alive connections kept open to the terminal.
+            Defaults to POOL_MAXSIZE.
+
+    Returns:
+        requests.Session: A session that keeps up to pool_maxsize connections to the
+        terminal open and retries transient failures according to RETRY.
+    """
+    session = requests.Session()
+    session.mount(base_url, HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=RETRY))
+    return session
+
+
+def _zstd_available() -> bool:
+    """Return True if pyarrow or the zstandard package can write zstd files."""
+    if pa is not None and pa.Codec.is_available("zstd"):
+        return True
+    return importlib.util.find_spec("zstandard") is not None
+
+
+def default_cache_dir() -> str:
+    """
+    Return the response cache directory used by the command line tool and examples.
+
+    Returns:
+        str: The THETADATA_CACHE_DIR environment variable if set, otherwise
+        ~/.cache/thetadata.
+    """
+    return os.environ.get(
+        CACHE_DIR_ENV, os.path.join(os.path.expanduser("~"), ".cache", "thetadata")
+    )
+
+
+# Narrower dtypes used when a client is created with downcast=True. Every
+# value these fields take fits in int32, and float32 keeps about 7 significant
+# digits. Volumes, counts and sequence numbers can exceed int32 and are left
+# alone.
+DOWNCAST_DTYPES = {
+    **dict.fromkeys(
+        [
+            "ms_of_day",
+            "ms_of_day2",
+            "date",
+            "bid_size",
+            "bid_exchange",
+            "bid_condition",
+            "ask_size",
+            "ask_exchange",
+            "ask_condition",
+            "size",
+            "exchange",
+            "condition",
+            "ext_condition1",
+            "ext_condition2",
+            "ext_condition3",
+            "ext_condition4",
+            "condition_flags",
+            "price_flags",
+            "volume_type",
+            "records_back",
+        ],
+        "int32",
+    ),
+    **dict.fromkeys(
+        [column for column, dtype in COLUMN_DTYPES.items() if dtype == "float64"],
+        "float32",
+    ),
+}
+
+# Text columns that repeat a handful of values, e.g. in bulk and CSV responses.
+CATEGORY_COLUMNS = ("root", "right")
+
+
+def _frame_from_rows(rows: list, columns: list) -> pd.DataFrame:
+    """
+    Build a DataFrame from the rows of an API response.
+
+    Args:
+        rows (list): The response rows, one list of values per row.
+        columns (list): The column names from the response header.
+
+    Returns:
+        pd.DataFrame: The same frame as pd.DataFrame(rows, columns=columns), except
+        that an empty response gets the COLUMN_DTYPES dtypes instead of object.
+    """
+    if not rows and len(set(columns)) == len(columns):
+        # Empty responses are common for illiquid contracts; copy a typed template.
+        return _empty_frame(tuple(columns)).copy()
+    plan = _column_plan(tuple(columns))
+    if plan is not None and isinstance(rows[0], list):
+        try:
+            return pd.DataFrame(
+                {column: _numeric_column(rows, i) for i, column in plan},
+                copy=False,
+            )
+        except (ValueError, IndexError, OverflowError):
+            pass  # Unexpected values; let pandas work out the types
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _frame_from_table(table: "pa.Table") -> pd.DataFrame:
+    """
+    Convert a parsed Arrow table to a DataFrame.
+
+    The columns are copied into pandas-owned blocks, so the frame is writable
+    like one built from a JSON response, even when the table is memory-mapped.
+
+    Args:
+        table (pa.Table): The parsed response.
+
+    Returns:
+        pd.DataFrame: The response as a writable DataFrame.
+    """
+    return table.to_pandas()
+
+
+def _frame_from_csv(text: str) -> pd.DataFrame:
+    """
+    Build a DataFrame from a CSV response body.
+
+    With pyarrow the text is parsed in C++ straight into typed columns, with no
+    Python object per value.
+
+    Args:
+        text (str): The CSV response, starting with a header row.
+
+    Returns:
+        pd.DataFrame: The parsed response.
+    """
+    if pa is not None:
+        try:
+            table = pa_csv.read_csv(
+                io.BytesIO(text.encode()), convert_options=_csv_convert_options()
+            )
+            return _frame_from_table(table)
+        except pa.ArrowInvalid:
+            pass  # Unexpected values; let pandas work out the types
+    return pd.read_csv(io.StringIO(text))
+
+
+def _read_csv_stream(raw) -> "pa.Table":
+    """
+    Parse a streamed CSV response body with pyarrow, block by block.
+
+    Args:
+        raw: The file-like raw body of a streamed requests response.
+
+    Returns:
+        pa.Table: The parsed response.
+    """
+    raw.decode_content = True
+    reader = pa_csv.open_csv(
+        raw,
+        read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=_csv_convert_options(),
+    )
+    return reader.read_all()
+
+
+@functools.cache
+def _csv_convert_options() -> "pa_csv.ConvertOptions":
+    """
+    Return the pyarrow CSV options that type the known columns like COLUMN_DTYPES.
+
+    Returns:
+        pa_csv.ConvertOptions: The conversion options for CSV responses.
+    """
+    types = {"int64": pa.int64(), "float64": pa.float64()}
+    return pa_csv.ConvertOptions(
+        column_types={column: types[dtype] for column, dtype in COLUMN_DTYPES.items()}
+    )
+
+
+@functools.cache
+def _empty_frame(columns: tuple) -> pd.DataFrame:
+    """
+    Return an empty DataFrame for a response schema, typed like COLUMN_DTYPES.
+
+    The result is cached per schema and must be copied before it is handed out.
+
+    Args:
+        columns (tuple): The column names from the response header.
+
+    Returns:
+        pd.DataFrame: A frame with no rows; unknown columns have object dtype.
+    """
+    return pd.DataFrame(
+        {
+            column: np.empty(0, dtype=COLUMN_DTYPES.get(column, object))
+            for column in columns
+        },
+        columns=list(columns),
+    )
+
+
+@functools.cache
+def _column_plan(columns: tuple) -> tuple | None:
+    """
+    Look up the position of each column of a response schema.
+
+    Each endpoint always returns the same header, so the result is cached per
+    schema instead of being worked out again for every response.
+
+    Args:
+        columns (tuple): The column names from the response header.
+
+    Returns:
+        tuple | None: (index, column) for each column, or None if a column is
+        not a known numeric column or is repeated.
+    """
+    if len(set(columns)) != len(columns) or not all(
+        column in COLUMN_DTYPES for column in columns
+    ):
+        return None
+    return tuple(enumerate(columns))
+
+
+def _numeric_column(rows: list, index: int) -> np.ndarray:
+    """
+    Extract one numeric column from the response rows.
+
+    Args:
+        rows (list): The response rows.
+        index (int): The position of the column in each row.
+
+    Returns:
+        np.ndarray: The column values, typed the way pandas would type them:
+        int64 if every value is an int, otherwise float64 with NaN for missing
+        values.
+
+    Raises:
+        ValueError: If the column holds anything other than ints, floats and
+        None, or only None. pandas makes such columns object columns.
+        OverflowError: If an int column does not fit in int64.
+    """
+    values = [row[index] for row in rows]
+    types = set(map(type, values))
+    if types == {int}:
+        return np.fromiter(values, dtype=np.int64, count=len(values))
+    if not types <= {int, float, type(None)} or types == {type(None)}:
+        raise ValueError("column is not numeric")
+    return np.fromiter(values, dtype=np.float64, count=len(values))
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the columns listed in DOWNCAST_DTYPES to their narrower dtype and
+    the text columns in CATEGORY_COLUMNS to categoricals.
+
+    Columns that did not come out of the response with their usual dtype, such
+    as an integer field holding missing values, are left unchanged.
+
+    Args:
+        df (pd.DataFrame): DataFrame built from an API response.
+
+    Returns:
+        pd.DataFrame: The DataFrame with narrowed columns.
+    """
+    dtypes = {
+        column: DOWNCAST_DTYPES[column]
+        for column in df.columns
+        if column in DOWNCAST_DTYPES and df[column].dtype == COLUMN_DTYPES[column]
+    }
+    dtypes.update(
+        (column, "category")
+        for column in CATEGORY_COLUMNS
+        if column in df.columns and pd.api.types.is_string_dtype(df[column])
+    )
+    return df.astype(dtypes) if dtypes else df
+
+
+def _add_timestamp(df: pd.DataFrame) -> None:
+    """
+    Add a 'timestamp' column built from the 'date' and 'ms_of_day' columns.
+
+    Both columns are converted in one vectorized pass; frames without integer
+    'date' and 'ms_of_day' columns are left unchanged.
+
+    Args:
+        df (pd.DataFrame): DataFrame built from an API response. Modified in place.
+    """
+    columns = ("date", "ms_of_day")
+    if not all(
+        column in df.columns and pd.api.types.is_integer_dtype(df[column])
+        for column in columns
+    ):
+        return
+    df["timestamp"] = pd.to_datetime(df["date"], format="%Y%m%d") + pd.to_timedelta(
+        df["ms_of_day"], unit="ms"
+    )
+
+
+def _writer_loop(write_queue: queue.Queue, logger: logging.Logger) -> None:
+    """
+    Write the DataFrames queued by a client with background_writes to disk one
+    at a time, until a None item asks the thread to stop.
+
+    Args:
+        write_queue (queue.Queue): The client's queue of (write, df, datatype, identifier) items.
+        logger (logging.Logger): The logger to report failed writes to.
+    """
+    while True:
+        item = write_queue.get()
+        if item is None:
+            write_queue.task_done()
+            return
+        write, df, datatype, identifier = item
+        try:
+            write(df, datatype, identifier)
+        except Exception:
+            logger.exception("Failed to write %s for %s", datatype, identifier)
+        finally:
+            write_queue.task_done()
+
+
+# Open clients with background_writes. Held weakly so that registering for the
+# exit flush does not keep a client alive.
+_background_clients = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_background_writes() -> None:
+    """Finish the queued writes of every open client before the interpreter exits."""
+    for client in list(_background_clients):
+        client.flush()
 
 
 class ThetaDataBase:
-    def __init__(self, log_level: str = "WARNING", output_dir: str = "./") -> None:
+    # Address of the Theta Terminal. Override it on a subclass to reach a
+    # terminal on another host or port.
+    base_url = BASE_URL
+
+    # Rows serialized at a time by the parallel pyarrow CSV writer, which bounds
+    # the memory used for output buffers regardless of the size of the frame.
+    csv_chunk_rows = 250_000
+
+    def __init__(
+        self,
+        log_level: str | None = None,
+        output_dir: str = "./",
+        cache_dir: str | None = None,
+        output_format: str = "csv",
+        session: requests.Session | None = None,
+        max_concurrency: int | None = None,
+        downcast: bool = False,
+        csv_compression: str | None = None,
+        add_timestamp: bool = False,
+        background_writes: bool = False,
+        timeout: float | tuple[float, float] | None = REQUEST_TIMEOUT,
+        pool_maxsize: int = POOL_MAXSIZE,
+    ) -> None:
         """
         Initialize the ThetaDataBase class.
 
         Parameters:
-        log_level (str): The logging level. Defaults to "WARNING".
+        log_level (str | None): The level of the library logger, shared by all clients. Defaults to None,
+            which leaves it to the application's logging configuration.
         output_dir (str): The directory to save output files. Defaults to "./".
+        cache_dir (str | None): The directory to cache API responses in. Defaults to the THETADATA_CACHE_DIR
+            environment variable, or None (no caching) if it is not set.
+        output_format (str): The file format used when write_csv is True. Must be either 'csv' or 'parquet'
+            (zstd-compressed, requires pyarrow). Defaults to "csv".
+        session (requests.Session | None): The HTTP session to send requests with. Pass the same session to
+            several clients to share their keep-alive connections. Defaults to a new session from
+            create_session(), which is closed by close().
+        max_concurrency (int | None): The maximum number of requests this client sends to the terminal at once,
+            e.g. the concurrent request limit of your ThetaData subscription. Defaults to None (no limit).
+        downcast (bool): If True, store the columns listed in DOWNCAST_DTYPES as int32/float32, halving their
+            memory and shortening written files, and the text columns in CATEGORY_COLUMNS as categoricals.
+            Prices and Greeks then keep about 7 significant digits.
+            Defaults to False.
+        csv_compression (str | None): Compress CSV output with 'gzip' (.csv.gz) or 'zstd' (.csv.zst). zstd needs
+            pyarrow or the zstandard package. Defaults to None (plain CSV).
+        add_timestamp (bool): If True, add a 'timestamp' column combining 'date' and 'ms_of_day' to responses
+            that have both. The values are naive datetimes in US Eastern time. Defaults to False.
+        background_writes (bool): If True, write output files on a background thread so the next request
+            does not wait for the disk. Pending writes are finished at exit; call flush() to wait for them
+            sooner, and close() to also stop the thread. Do not modify a returned DataFrame before its file is written. Defaults to False.
+        timeout (float | tuple[float, float] | None): The requests timeout, in seconds, for each request, as one
+            value or a (connect, read) pair. None waits forever. Defaults to REQUEST_TIMEOUT.
+        pool_maxsize (int): The number of keep-alive connections the client's own session keeps open. Raise it
+            along with the worker count of send_many or get_many. Ignored when session is passed.
+            Defaults to POOL_MAXSIZE.
 
-        This constructor sets up logging and initializes the output directory.
+        This constructor sets up the library logger and initializes the output directory.
         """
-        # Configure logging
-        logging.basicConfig(
-            level=getattr(logging, log_level.upper()),
-            format="%(asctime)s - %(levelname)s - %(message)s",
-        )
+        # Output is left to the application's logging setup. Without one,
+        # Python's last-resort handler still prints warnings and errors.
         self.logger = logging.getLogger(__name__)
+        if log_level is not None:
+            self.logger.setLevel(log_level.upper())
         self.output_dir = output_dir
+        self.cache_dir = (
+            cache_dir if cache_dir is not None else os.environ.get(CACHE_DIR_ENV)
+        )
+        self.output_format = output_format
+        self.downcast = downcast
+        if csv_compression is not None and csv_compression not in CSV_COMPRESSIONS:
+            raise ValueError("csv_compression must be either 'gzip' or 'zstd'")
+        # Like parquet output, fail now rather than after the data has been downloaded.
+        if csv_compression == "zstd" and not _zstd_available():
+            raise ValueError("csv_compression 'zstd' requires pyarrow or zstandard")
+        self.csv_compression = csv_compression
+        self.add_timestamp = add_timestamp
+        self.timeout = timeout
+        self._write_queue = None
+        if background_writes:
+            self._write_queue = queue.Queue(maxsize=8)
+            # The thread holds only the queue, not the client, so an unclosed
+            # client can still be garbage-collected; that stops the thread.
+            self._writer = threading.Thread(
+                target=_writer_loop, args=(self._write_queue, self.logger), daemon=True
+            )
+            self._writer.start()
+            self._stop_writer = weakref.finalize(self, self._write_queue.put, None)
+            self._stop_writer.atexit = False
+            # The writer is a daemon thread, so finish queued files before the interpreter exits.
+            _background_clients.add(self)
+        # A session passed in belongs to the caller, who configures and closes it.
+        self._owns_session = session is None
+        if session is None:
+            session = create_session(self.base_url, pool_maxsize)
+        session.headers["Accept"] = "application/json"
+        self.session = session
+        self._request_slots = (
+            threading.BoundedSemaphore(max_concurrency)
+            if max_concurrency
+            else contextlib.nullcontext()
+        )
+
+    @property
+    def output_dir(self) -> str:
+        """The directory output files are written to. It is created when set."""
+        return self._output_dir
+
+    @output_dir.setter
+    def output_dir(self, output_dir: str) -> None:
+        # Creating the directory here keeps the existence check off the write path.
+        if not os.path.isdir(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+            self.logger.info("Created output directory: %s", output_dir)
+        self._output_dir = output_dir
+
+    @property
+    def output_format(self) -> str:
+        """The file format used when write_csv is True, 'csv' or 'parquet'."""
+        return self._output_format
+
+    @output_format.setter
+    def output_format(self, output_format: str) -> None:
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError("output_format must be either 'csv' or 'parquet'")
+        # Fail now rather than after the data has been downloaded.
+        if output_format == "parquet" and pa is None:
+            raise ValueError("output_format 'parquet' requires pyarrow")
+        self._output_format = output_format
+
+    def close(self) -> None:
+        """
+        Finish pending background writes and stop the writer thread, then close
+        the HTTP session and its pooled connections, unless it was passed in.
 
-    def send_request(self, endpoint: str, params: dict) -> dict | None:
+        Files written after closing are written on the calling thread.
+        """
+        if self._write_queue is not None:
+            self._stop_writer()
+            self._writer.join()
+            _background_clients.discard(self)
+            self._write_queue = None
+        if self._owns_session:
+            self.session.close()
+
+    def flush(self) -> None:
+        """Block until every queued background write has finished."""
+        if self._write_queue is not None:
+            self._write_queue.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def send_request(
+        self, endpoint: str, params: dict, use_cache: bool = True
+    ) -> dict | None:
         """
         Send a GET request to the specified endpoint with the given parameters.
 
         Args:
             endpoint (str): The API endpoint to send the request to.
             params (dict): A dictionary of query parameters to include in the request.
+            use_cache (bool): If False, neither read nor write the response cache for this request. Defaults to True.
+
+        Returns:
+            dict | None: The JSON response from the API if successful, or None if an error occurs.
+        """
+        ttl = self._cache_ttl(endpoint, params) if self.cache_dir and use_cache else 0
+        if ttl != 0:
+            # Streamed CSV responses arrive as Arrow tables and are cached as Arrow files.
+            arrow = pa is not None and params.get("use_csv") == "true"
+            cache_path = self._cache_path(endpoint, params, arrow)
+            cached = self._read_cache(cache_path, ttl)
+            if cached is not None:
+                self.logger.info("Using cached response: %s", cache_path)
+                return cached
+
+        data = self._get(self.base_url + endpoint, params)
+        if data is not None and ttl != 0:
+            self._write_cache(cache_path, data)
+        return data
+
+    def prepare(self, endpoint: str, params: dict) -> str:
+        """
+        Build the full request URL for an endpoint and its parameters.
+
+        Encoding the parameters once lets tight loops reuse, deduplicate or
+        batch the URLs and send them with send_prepared or send_many.
+
+        Args:
+            endpoint (str): The API endpoint to send the request to.
+            params (dict): A dictionary of query parameters to include in the request.
+
+        Returns:
+            str: The request URL with its query string.
+        """
+        return f"{self.base_url}{endpoint}?{urlencode(params, doseq=True)}"
+
+    def send_prepared(self, url: str) -> dict | None:
+        """
+        Send a GET request to a URL built by prepare.
+
+        Prepared requests bypass the response cache.
+
+        Args:
+            url (str): The request URL returned by prepare.
+
+        Returns:
+            dict | None: The JSON response from the API if successful, or None if an error occurs.
+        """
+        return self._get(url)
+
+    def _get(self, url: str, params: dict | None = None) -> dict | None:
+        """
+        Send a GET request and decode its JSON body.
+
+        A CSV body, requested with use_csv=true, is returned undecoded as
+        {"csv": text} for _process_response to parse. With pyarrow
+        installed it is instead streamed and parsed block by block as it
+        arrives, so the raw body is never held in memory, and returned as
+        {"table": pyarrow.Table}.
+
+        Args:
+            url (str): The URL to request.
+            params (dict | None): Query parameters to add to the URL. Defaults to None.
 
         Returns:
             dict | None: The JSON response from the API if successful, or None if an error occurs.
         """
-        url = f"http://127.0.0.1:25510{endpoint}"
-        headers = {"Accept": "application/json"}
         response = None
+        csv = (params or {}).get("use_csv") == "true" or parse_qs(
+            urlsplit(url).query
+        ).get("use_csv") == ["true"]
+        stream = csv and pa is not None
 
         try:
-            self.logger.debug(f"Sending request to {url} with params: {params}")
-            response = requests.get(url, headers=headers, params=params)
+            self.logger.debug("Sending request to %s with params: %s", url, params)
+            with self._request_slots:
+                if stream:
+                    # Closing the response returns its connection to the pool,
+                    # also when the status or the body is bad.
+                    response = self.session.get(
+                        url, params=params, timeout=self.timeout, stream=True
+                    )
+                    with response:
+                        response.raise_for_status()
+                        table = _read_csv_stream(response.raw)
+                    self.logger.info("Request successful")
+                    return {"table": table}
+                response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             self.logger.info("Request successful")
-            return response.json()
-        except requests.RequestException as e:
-            self.logger.error(f"An error occurred: {e}")
+            if csv:
+                if not response.text.strip():
+                    raise ValueError("Empty CSV response")
+                return {"csv": response.text}
+            return _json_loads(response.content)
+        except (requests.RequestException, ValueError) as e:
+            self.logger.error("An error occurred: %s", e)
+            # A streamed body has been consumed or closed and cannot be shown.
             self.logger.error(
-                f"Response text: {response.text if response else 'No response'}"
+                "Response text: %s",
+                response.text if response and not stream else "No response",
             )
             return None
 
+    def send_many(
+        self, calls: list[tuple[str, dict] | str], max_workers: int = 8
+    ) -> list[dict | None]:
+        """
+        Send several GET requests concurrently.
+
+        The requests share this client's session and cache, and each one is
+        handled exactly like a call to send_request, or to send_prepared for
+        URLs built by prepare.
+
+        Args:
+            calls (list[tuple[str, dict] | str]): (endpoint, params) pairs or prepared URLs to request.
+            max_workers (int): The maximum number of requests in flight at once. Defaults to 8.
+
+        Returns:
+            list[dict | None]: The JSON responses, in the same order as calls. Failed requests give None.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._send_call, calls))
+
+    def get_many(
+        self, method: str, calls: list[dict], max_workers: int = 8
+    ) -> list[pd.DataFrame | None]:
+        """
+        Call one of this client's get_* methods for several argument sets concurrently.
+
+        The calls share this client's session and cache, so fetching many contracts
+        costs about as much wall time as the slowest few rather than their sum.
+
+        Args:
+            method (str): The name of the method to call, e.g. 'get_historical_greeks'.
+            calls (list[dict]): The keyword arguments of each call.
+            max_workers (int): The maximum number of calls in flight at once. Defaults to 8.
+
+        Returns:
+            list[pd.DataFrame | None]: The results, in the same order as calls.
+
+        Raises:
+            ValueError: If method is not a get_* endpoint method of this client, or a call has invalid
+                parameters. get_many itself and the other *_many helpers are rejected.
+        """
+        # Endpoint methods are defined by the concrete clients; helpers such as
+        # get_many would dispatch back into a pool of their own.
+        if (
+            not method.startswith("get_")
+            or method.endswith("_many")
+            or hasattr(ThetaDataBase, method)
+            or not hasattr(self, method)
+        ):
+            raise ValueError(f"{type(self).__name__} has no endpoint method {method!r}")
+        fn = getattr(self, method)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda kwargs: fn(**kwargs), calls))
+
+    def _send_call(self, call: tuple[str, dict] | str) -> dict | None:
+        """
+        Send one entry of a send_many batch.
+
+        Args:
+            call (tuple[str, dict] | str): An (endpoint, params) pair or a prepared URL.
+
+        Returns:
+            dict | None: The JSON response from the API if successful, or None if an error occurs.
+        """
+        if isinstance(call, str):
+            return self.send_prepared(call)
+        return self.send_request(*call)
+
+    def _cache_ttl(self, endpoint: str, params: dict) -> float | None:
+        """
+        Return how long a response for this request may be served from the cache.
+
+        Args:
+            endpoint (str): The API endpoint of the request.
+            params (dict): The query parameters of the request.
+
+        Returns:
+            float | None: The lifetime in seconds, None if the response never
+            expires, or 0 if it should not be cached.
+        """
+        if "snapshot" in endpoint:
+            return SNAPSHOT_CACHE_TTL
+
+        # Data for a date range that has already closed no longer changes.
+        end_date = params.get("end_date")
+        today = datetime.datetime.now(MARKET_TZ).strftime("%Y%m%d")
+        if end_date and str(end_date) < today:
+            return None
+        if end_date:
+            return OPEN_RANGE_CACHE_TTL
+        return 0
+
+    def _cache_path(self, endpoint: str, params: dict, arrow: bool = False) -> str:
+        """
+        Return the cache file path for a request.
+
+        Args:
+            endpoint (str): The API endpoint of the request.
+            params (dict): The query parameters of the request.
+            arrow (bool): If True, return the path of an Arrow file instead of a JSON file. Defaults to False.
+
+        Returns:
+            str: Path of the cache file, keyed by a hash of the endpoint and parameters.
+        """
+        key = json.dumps([endpoint, params], sort_keys=True, default=str)
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.{'arrow' if arrow else 'json'}")
+
+    def _read_cache(self, cache_path: str, ttl: float | None) -> dict | None:
+        """
+        Read a cached response if it exists and has not expired.
+
+        Arrow files are memory-mapped, so their columns are only paged in from
+        disk when they are used.
+
+        Args:
+            cache_path (str): Path of the cache file.
+            ttl (float | None): Lifetime in seconds, or None if it never expires.
+
+        Returns:
+            dict | None: The cached response, or None on a cache miss.
+        """
+        try:
+            if ttl is not None and time.time() - os.path.getmtime(cache_path) > ttl:
+                return None
+            if cache_path.endswith(".arrow"):
+                return {"table": pa.ipc.open_file(pa.memory_map(cache_path)).read_all()}
+            with open(cache_path, "rb") as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, cache_path: str, data: dict) -> None:
+        """
+        Write a response to the cache.
+
+        Args:
+            cache_path (str): Path of the cache file.
+            data (dict): The response to cache.
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file and rename it into place, so that other
+            # processes and threads never read a half-written entry.
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    if "table" in data:
+                        with pa.ipc.new_file(f, data["table"].schema) as writer:
+                            writer.write_table(data["table"])
+                    else:
+                        f.write(_json_dumps(data))
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self.logger.warning("Could not write cache file %s: %s", cache_path, e)
+
     def _process_response(
-        self, response: dict | None, write_csv: bool, datatype: str, identifier: str
-    ) -> pd.DataFrame | None:
+        self,
+        response: dict | None,
+        write_csv: bool,
+        datatype: str,
+        identifier: str,
+        return_dict: bool = False,
+    ) -> pd.DataFrame | dict | None:
         """
         Process the API response and return a DataFrame.
 
@@ -62,22 +939,90 @@ class ThetaDataBase:
             write_csv (bool): If True, write the DataFrame to a CSV file.
             datatype (str): Type of data (e.g., 'quotes', 'ohlc', 'trades').
             identifier (str): The data identifier (e.g., symbol or option identifier).
+            return_dict (bool): If True and write_csv is False, return a single-row JSON response as a
+                {column: value} dict without building a DataFrame. Defaults to False.
 
         Returns:
-            pd.DataFrame | None: DataFrame of data, or None if response is None.
+            pd.DataFrame | dict | None: DataFrame of data (or dict of the row), or None if response is None.
         """
+        if (
+            return_dict
+            and not write_csv
+            and response
+            and "response" in response
+            and len(response["response"]) == 1
+        ):
+            return dict(zip(response["header"]["format"], response["response"][0]))
         if response:
-            columns = response["header"]["format"]
-            data = response["response"]
-            df = pd.DataFrame(data, columns=columns)
+            if "table" in response:
+                df = _frame_from_table(response["table"])
+            elif "csv" in response:
+                df = _frame_from_csv(response["csv"])
+            else:
+                df = _frame_from_rows(
+                    response["response"], response["header"]["format"]
+                )
+            if self.downcast:
+                df = _downcast(df)
+            if self.add_timestamp:
+                _add_timestamp(df)
 
             if write_csv:
-                self._write_csv(df, datatype, identifier)
+                self._write_output(df, datatype, identifier)
 
             return df
         else:
             return None
 
+    def _write_output(
+        self,
+        df: pd.DataFrame,
+        datatype: str,
+        identifier: str,
+    ) -> None:
+        """
+        Write DataFrame to a file in the configured output format.
+
+        Args:
+            df (pd.DataFrame): DataFrame to write
+            datatype (str): Type of data (e.g., 'quotes', 'ohlc', 'trades')
+            identifier (str): The data identifier (e.g., symbol or option identifier)
+        """
+        # Pick the writer now, as the output format may change before a queued write runs.
+        if self.output_format == "parquet":
+            write = self._write_parquet
+        else:
+            write = self._write_csv
+        if self._write_queue is not None:
+            self._write_queue.put((write, df, datatype, identifier))
+        else:
+            write(df, datatype, identifier)
+
+    def _write_parquet(
+        self,
+        df: pd.DataFrame,
+        datatype: str,
+        identifier: str,
+    ) -> None:
+        """
+        Write DataFrame to a zstd-compressed Parquet file.
+
+        Args:
+            df (pd.DataFrame): DataFrame to write
+            datatype (str): Type of data (e.g., 'quotes', 'ohlc', 'trades')
+            identifier (str): The data identifier (e.g., symbol or option identifier)
+        """
+        filename = f"{datatype}_{identifier}.parquet"
+        filepath = os.path.join(self.output_dir, filename)
+        df.to_parquet(
+            filepath,
+            engine="pyarrow",
+            compression="zstd",
+            index=False,
+            row_group_size=100_000,
+        )
+        self.logger.info("Parquet file written: %s", filepath)
+
     def _write_csv(
         self,
         df: pd.DataFrame,
@@ -87,16 +1032,98 @@ class ThetaDataBase:
         """
         Write DataFrame to CSV file.
 
+        With pyarrow installed, the file is formatted by pyarrow: the header and
+        text values are always quoted, booleans are written as true/false,
+        whole floats lose their trailing ".0", and timestamps keep six decimal
+        places. Without pyarrow, pandas writes the same data unquoted, with
+        True/False and millisecond timestamps. Both read back to the same frame
+        with pd.read_csv.
+
         Args:
             df (pd.DataFrame): DataFrame to write
             datatype (str): Type of data (e.g., 'quotes', 'ohlc', 'trades')
             identifier (str): The data identifier (e.g., symbol or option identifier)
         """
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-            self.logger.info(f"Created output directory: {self.output_dir}")
-
         filename = f"{datatype}_{identifier}.csv"
+        if self.csv_compression:
+            filename += CSV_COMPRESSIONS[self.csv_compression]
         filepath = os.path.join(self.output_dir, filename)
-        df.to_csv(filepath, index=False)
-        self.logger.info(f"CSV file written: {filepath}")
+        if pa is not None:
+            # pyarrow formats each column with a typed C++ kernel, which is far
+            # faster than pandas' per-cell string conversion.
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                workers = os.cpu_count() or 1
+                if table.num_rows > PARALLEL_CSV_ROWS and workers > 1:
+                    self._write_csv_parallel(table, filepath, workers)
+                else:
+                    with self._open_csv_sink(filepath) as sink:
+                        pa_csv.write_csv(
+                            table,
+                            sink,
+                            write_options=pa_csv.WriteOptions(batch_size=65536),
+                        )
+                self.logger.info("CSV file written: %s", filepath)
+                return
+            except pa.ArrowException as e:
+                self.logger.debug("pyarrow CSV writer failed, using pandas: %s", e)
+        # pandas writes row batches through the csv module, sized to about 100k
+        # cells by default; a 1 MiB buffer turns them into a few large write()
+        # calls instead of one per 8 KiB.
+        if self.csv_compression:
+            df.to_csv(filepath, index=False, compression=self.csv_compression)
+        else:
+            with open(filepath, "w", buffering=1 << 20, newline="") as f:
+                df.to_csv(f, index=False)
+        self.logger.info("CSV file written: %s", filepath)
+
+    def _open_csv_sink(self, filepath: str):
+        """
+        Open a pyarrow output stream for a CSV file, compressed if configured.
+
+        Args:
+            filepath (str): Path of the CSV file
+
+        Returns:
+            pyarrow.NativeFile: The stream to write the CSV bytes to.
+        """
+        if self.csv_compression:
+            return pa.CompressedOutputStream(filepath, self.csv_compression)
+        return pa.OSFile(filepath, "wb")
+
+    def _write_csv_parallel(self, table, filepath: str, workers: int) -> None:
+        """
+        Serialize a pyarrow Table to CSV on several threads and write it in order.
+
+        The table is split into slices of at most csv_chunk_rows rows. pyarrow
+        releases the GIL while formatting, so up to one slice per worker is
+        serialized concurrently; the buffers are then written to the file in
+        their original order before the next slices are started.
+
+        Args:
+            table (pyarrow.Table): Table to write
+            filepath (str): Path of the CSV file
+            workers (int): Number of threads to use
+        """
+        num_rows = table.num_rows
+        step = min(self.csv_chunk_rows, -(-num_rows // workers))
+
+        def serialize(offset: int):
+            sink = pa.BufferOutputStream()
+            pa_csv.write_csv(
+                table.slice(offset, step),
+                sink,
+                write_options=pa_csv.WriteOptions(
+                    include_header=offset == 0, batch_size=65536
+                ),
+            )
+            return sink.getvalue()
+
+        with (
+            ThreadPoolExecutor(max_workers=workers) as executor,
+            self._open_csv_sink(filepath) as f,
+        ):
+            for start in range(0, num_rows, step * workers):
+                offsets = range(start, min(start + step * workers, num_rows), step)
+                for buffer in executor.map(serialize, offsets):
+                    f.write(buffer)
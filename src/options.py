@@ -1,21 +1,120 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
 import pandas as pd
 
 from .base import ThetaDataBase
 from .utils import is_valid_right, is_valid_ivl
 
 
+class _BoolStr(dict):
+    """Query-string spelling of boolean parameters."""
+
+    def __missing__(self, value) -> str:
+        # Values other than True and False are sent as before, e.g. "false".
+        return str(value).lower()
+
+
+_BOOL_STR = _BoolStr({True: "true", False: "false"})
+
+
+def _contract_params(
+    root: str,
+    exp: str,
+    strike: int,
+    right: str,
+    start_date: str,
+    end_date: str,
+    **extra,
+) -> dict:
+    """
+    Validate an option contract and build the query parameters for a date range request.
+
+    Args:
+        root (str): The symbol of the security.
+        exp (str): The expiration date of the option contract formatted as YYYYMMDD.
+        strike (int): The strike price in 1/10ths of a cent.
+        right (str): The right of the option. 'C' for call; 'P' for put.
+        start_date (str): The start date (inclusive) of the request formatted as YYYYMMDD.
+        end_date (str): The end date (inclusive) of the request formatted as YYYYMMDD.
+        **extra: Further query parameters, already in their query-string form.
+
+    Returns:
+        dict: The query parameters.
+
+    Raises:
+        ValueError: If right is not 'C' or 'P'.
+    """
+    if not is_valid_right(right):
+        raise ValueError("right must be either 'C' or 'P'")
+    return {
+        "root": root,
+        "exp": exp,
+        "strike": strike,
+        "right": right,
+        "start_date": start_date,
+        "end_date": end_date,
+        **extra,
+    }
+
+
+def _map_parallel(
+    fn: Callable,
+    names: tuple[str, ...],
+    arglist: list[tuple],
+    max_workers: int,
+    *args,
+    **kwargs,
+) -> pd.DataFrame | None:
+    """
+    Call fn once per item of arglist from a thread pool and concatenate the results.
+
+    Each call is fn(*args, *item, **kwargs), and its frame is tagged with the
+    item's values in columns named by names, unless the response already has them.
+
+    Args:
+        fn (Callable): Function returning a DataFrame, or None if its request fails.
+        names (tuple[str, ...]): The column name for each value of an item.
+        arglist (list[tuple]): The varying positional arguments, one call per item.
+        max_workers (int): The maximum number of calls in flight at once.
+        *args: The leading positional arguments of every call.
+        **kwargs: The keyword arguments of every call.
+
+    Returns:
+        pd.DataFrame | None: The results in arglist order, or None if every call failed.
+    """
+
+    def fetch(item):
+        df = fn(*args, *item, **kwargs)
+        if df is None:
+            return None
+        tags = dict(zip(names, item))
+        return df.assign(**{k: v for k, v in tags.items() if k not in df.columns})
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(fetch, arglist))
+    frames = [df for df in results if df is not None]
+    if not frames:
+        return None
+    return pd.concat(frames, ignore_index=True)
+
+
 class ThetaDataOptions(ThetaDataBase):
-    def __init__(self, log_level: str = "WARNING", output_dir: str = "./") -> None:
+    def __init__(
+        self, log_level: str | None = None, output_dir: str = "./", **kwargs
+    ) -> None:
         """
         Initialize the ThetaDataOptionsSnapshot class.
 
         Parameters:
-        log_level (str): The logging level. Defaults to "WARNING".
+        log_level (str | None): The level of the library logger, shared by all clients. Defaults to None,
+            which leaves it to the application's logging configuration.
         output_dir (str): The directory to save output files. Defaults to "./".
+        **kwargs: Additional options passed to ThetaDataBase (e.g. cache_dir, output_format).
 
         This constructor sets up logging and initializes the output directory.
         """
-        super().__init__(log_level, output_dir)
+        super().__init__(log_level, output_dir, **kwargs)
 
     def get_quote_at_time(
         self,
@@ -28,7 +127,8 @@ class ThetaDataOptions(ThetaDataBase):
         ivl: int,
         rth: bool = True,
         write_csv: bool = False,
-    ) -> pd.DataFrame | None:
+        return_dict: bool = False,
+    ) -> pd.DataFrame | dict | None:
         """
         Get the last NBBO quote reported by OPRA at a specified millisecond of the day.
 
@@ -42,14 +142,21 @@ class ThetaDataOptions(ThetaDataBase):
             ivl (int): The interval size in milliseconds. Must be between 100 and 3600000.
             rth (bool, optional): If False, include data outside regular trading hours. Defaults to True.
             write_csv (bool, optional): If True, write the DataFrame to a CSV file. Defaults to False.
+            return_dict (bool, optional): If True and the response is a single row (e.g. one day), return it as a
+                {column: value} dict instead of a DataFrame, which is much cheaper to build. Ignored when write_csv
+                is True. Defaults to False.
 
         Returns:
-            pd.DataFrame | None: DataFrame of quote data, or None if request fails
+            pd.DataFrame | dict | None: DataFrame of quote data (or dict of the single row), or None if request fails
 
         Raises:
             ValueError: If invalid parameters are provided.
+
+        Note:
+            - To get trades together with the NBBO quote at each trade, call get_historical_trade_quote once
+              instead of requesting trades and quotes separately.
         """
-        self.logger.info(f"Getting quote at time for {root} option")
+        self.logger.info("Getting quote at time for %s option", root)
         endpoint = "/v2/at_time/option/quote"
 
         if not is_valid_right(right):
@@ -66,12 +173,16 @@ class ThetaDataOptions(ThetaDataBase):
             "start_date": start_date,
             "end_date": end_date,
             "ivl": ivl,
-            "rth": str(rth).lower(),
+            "rth": _BOOL_STR[rth],
         }
 
         response = self.send_request(endpoint, params)
         return self._process_response(
-            response, write_csv, "option_quote", f"{root}_{exp}_{strike}_{right}"
+            response,
+            write_csv,
+            "option_quote",
+            f"{root}_{exp}_{strike}_{right}",
+            return_dict,
         )
 
     def get_trade_at_time(
@@ -85,7 +196,8 @@ class ThetaDataOptions(ThetaDataBase):
         ivl: int,
         rth: bool = True,
         write_csv: bool = False,
-    ) -> pd.DataFrame | None:
+        return_dict: bool = False,
+    ) -> pd.DataFrame | dict | None:
         """
         Get the last trade reported by OPRA at a specified millisecond of the day.
 
@@ -99,14 +211,21 @@ class ThetaDataOptions(ThetaDataBase):
             ivl (int): The interval size in milliseconds. Must be between 100 and 3600000.
             rth (bool, optional): If False, include data outside regular trading hours. Defaults to True.
             write_csv (bool, optional): If True, write the DataFrame to a CSV file. Defaults to False.
+            return_dict (bool, optional): If True and the response is a single row (e.g. one day), return it as a
+                {column: value} dict instead of a DataFrame, which is much cheaper to build. Ignored when write_csv
+                is True. Defaults to False.
 
         Returns:
-            pd.DataFrame | None: DataFrame of trade data, or None if request fails
+            pd.DataFrame | dict | None: DataFrame of trade data (or dict of the single row), or None if request fails
 
         Raises:
             ValueError: If invalid parameters are provided.
+
+        Note:
+            - To get trades together with the NBBO quote at each trade, call get_historical_trade_quote once
+              instead of requesting trades and quotes separately.
         """
-        self.logger.info(f"Getting trade at time for {root} option")
+        self.logger.info("Getting trade at time for %s option", root)
         endpoint = "/v2/at_time/option/trade"
 
         if not is_valid_right(right):
@@ -123,12 +242,16 @@ class ThetaDataOptions(ThetaDataBase):
             "start_date": start_date,
             "end_date": end_date,
             "ivl": ivl,
-            "rth": str(rth).lower(),
+            "rth": _BOOL_STR[rth],
         }
 
         response = self.send_request(endpoint, params)
         return self._process_response(
-            response, write_csv, "option_trade", f"{root}_{exp}_{strike}_{right}"
+            response,
+            write_csv,
+            "option_trade",
+            f"{root}_{exp}_{strike}_{right}",
+            return_dict,
         )
 
     def get_bulk_quote_at_time(
@@ -139,6 +262,7 @@ class ThetaDataOptions(ThetaDataBase):
         end_date: str,
         ivl: int,
         rth: bool = True,
+        use_csv: bool = False,
         write_csv: bool = False,
     ) -> pd.DataFrame | None:
         """
@@ -152,6 +276,8 @@ class ThetaDataOptions(ThetaDataBase):
             end_date (str): The end date (inclusive) of the request formatted as YYYYMMDD.
             ivl (int): The interval size in milliseconds. Must be between 100 and 3600000.
             rth (bool, optional): If False, include data outside regular trading hours. Defaults to True.
+            use_csv (bool, optional): If True, request a CSV response instead of JSON. With pyarrow installed it is
+                parsed as it streams in, which keeps peak memory low for whole chains. Defaults to False.
             write_csv (bool, optional): If True, write the DataFrame to a CSV file. Defaults to False.
 
         Returns:
@@ -172,7 +298,7 @@ class ThetaDataOptions(ThetaDataBase):
             ask_condition: The last NBBO ask condition.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting bulk quote at time for {root} options")
+        self.logger.info("Getting bulk quote at time for %s options", root)
         endpoint = "/v2/bulk_at_time/option/quote"
 
         if not is_valid_ivl(ivl):
@@ -184,7 +310,8 @@ class ThetaDataOptions(ThetaDataBase):
             "start_date": start_date,
             "end_date": end_date,
             "ivl": ivl,
-            "rth": str(rth).lower(),
+            "rth": _BOOL_STR[rth],
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -200,6 +327,7 @@ class ThetaDataOptions(ThetaDataBase):
         end_date: str,
         ivl: int,
         rth: bool = True,
+        use_csv: bool = False,
         write_csv: bool = False,
     ) -> pd.DataFrame | None:
         """
@@ -213,6 +341,8 @@ class ThetaDataOptions(ThetaDataBase):
             end_date (str): The end date (inclusive) of the request formatted as YYYYMMDD.
             ivl (int): The interval size in milliseconds. Must be between 100 and 3600000.
             rth (bool, optional): If False, include data outside regular trading hours. Defaults to True.
+            use_csv (bool, optional): If True, request a CSV response instead of JSON. With pyarrow installed it is
+                parsed as it streams in, which keeps peak memory low for whole chains. Defaults to False.
             write_csv (bool, optional): If True, write the DataFrame to a CSV file. Defaults to False.
 
         Returns:
@@ -229,7 +359,7 @@ class ThetaDataOptions(ThetaDataBase):
             conditions: The trade conditions.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting bulk trade at time for {root} options")
+        self.logger.info("Getting bulk trade at time for %s options", root)
         endpoint = "/v2/bulk_at_time/option/trade"
 
         if not is_valid_ivl(ivl):
@@ -241,7 +371,8 @@ class ThetaDataOptions(ThetaDataBase):
             "start_date": start_date,
             "end_date": end_date,
             "ivl": ivl,
-            "rth": str(rth).lower(),
+            "rth": _BOOL_STR[rth],
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -304,7 +435,7 @@ class ThetaDataOptions(ThetaDataBase):
             ask_condition: The last NBBO ask condition.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting historical EOD report for {root} option")
+        self.logger.info("Getting historical EOD report for %s option", root)
         endpoint = "/v2/hist/option/eod"
 
         if not is_valid_right(right):
@@ -336,6 +467,7 @@ class ThetaDataOptions(ThetaDataBase):
         rth: bool = True,
         start_time: str = None,
         end_time: str = None,
+        use_csv: bool = False,
         write_csv: bool = False,
     ) -> pd.DataFrame | None:
         """
@@ -352,6 +484,8 @@ class ThetaDataOptions(ThetaDataBase):
             rth (bool, optional): If False, include data outside regular trading hours. Defaults to True.
             start_time (str, optional): If specified, include all ticks on or after this time.
             end_time (str, optional): If specified, include all ticks on or before this time.
+            use_csv (bool, optional): If True, request a CSV response instead of JSON. It is parsed with pyarrow when
+                installed, which is faster for tick-level data. Defaults to False.
             write_csv (bool, optional): If True, write the DataFrame to a CSV file. Defaults to False.
 
         Returns:
@@ -376,7 +510,7 @@ class ThetaDataOptions(ThetaDataBase):
             ask_condition: The last NBBO ask condition.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting historical quotes for {root} option")
+        self.logger.info("Getting historical quotes for %s option", root)
         endpoint = "/v2/hist/option/quote"
 
         if not is_valid_right(right):
@@ -393,7 +527,8 @@ class ThetaDataOptions(ThetaDataBase):
             "start_date": start_date,
             "end_date": end_date,
             "ivl": ivl,
-            "rth": str(rth).lower(),
+            "rth": _BOOL_STR[rth],
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         if start_time:
@@ -418,6 +553,7 @@ class ThetaDataOptions(ThetaDataBase):
         rth: bool = True,
         start_time: str = None,
         end_time: str = None,
+        use_csv: bool = False,
         write_csv: bool = False,
     ) -> pd.DataFrame | None:
         """
@@ -434,6 +570,8 @@ class ThetaDataOptions(ThetaDataBase):
             rth (bool, optional): If False, include data outside regular trading hours. Defaults to True.
             start_time (str, optional): If specified, include all ticks on or after this time.
             end_time (str, optional): If specified, include all ticks on or before this time.
+            use_csv (bool, optional): If True, request a CSV response instead of JSON. It is parsed with pyarrow when
+                installed, which is faster for tick-level data. Defaults to False.
             write_csv (bool, optional): If True, write the DataFrame to a CSV file. Defaults to False.
 
         Returns:
@@ -457,7 +595,7 @@ class ThetaDataOptions(ThetaDataBase):
             count: The amount of trades.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting historical OHLC for {root} option")
+        self.logger.info("Getting historical OHLC for %s option", root)
         endpoint = "/v2/hist/option/ohlc"
 
         if not is_valid_right(right):
@@ -474,7 +612,8 @@ class ThetaDataOptions(ThetaDataBase):
             "start_date": start_date,
             "end_date": end_date,
             "ivl": ivl,
-            "rth": str(rth).lower(),
+            "rth": _BOOL_STR[rth],
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         if start_time:
@@ -487,6 +626,108 @@ class ThetaDataOptions(ThetaDataBase):
             response, write_csv, "historical_ohlc", f"{root}_{exp}_{strike}_{right}"
         )
 
+    def get_historical_quotes_many(
+        self,
+        root: str,
+        contracts: list[tuple[str, int, str]],
+        start_date: str,
+        end_date: str,
+        ivl: int = 0,
+        rth: bool = True,
+        start_time: str = None,
+        end_time: str = None,
+        write_csv: bool = False,
+        max_workers: int = 16,
+    ) -> pd.DataFrame | None:
+        """
+        Get historical NBBO quotes for several option contracts concurrently.
+
+        Each contract is requested with get_historical_quotes from a thread pool.
+
+        Args:
+            root (str): The symbol of the security.
+            contracts (list[tuple[str, int, str]]): (exp, strike, right) for each contract, as for get_historical_quotes.
+            start_date (str): The start date (inclusive) of the request formatted as YYYYMMDD.
+            end_date (str): The end date (inclusive) of the request formatted as YYYYMMDD.
+            ivl (int, optional): The interval size in milliseconds. If 0 or omitted, provides tick-level data. Defaults to 0.
+            rth (bool, optional): If False, include data outside regular trading hours. Defaults to True.
+            start_time (str, optional): If specified, include all ticks on or after this time.
+            end_time (str, optional): If specified, include all ticks on or before this time.
+            write_csv (bool, optional): If True, write one CSV file per contract. Defaults to False.
+            max_workers (int, optional): The maximum number of requests in flight at once. Defaults to 16.
+
+        Returns:
+            pd.DataFrame | None: The get_historical_quotes columns plus exp, strike and right, or None if every request fails
+
+        Raises:
+            ValueError: If invalid parameters are provided.
+        """
+        return _map_parallel(
+            self.get_historical_quotes,
+            ("exp", "strike", "right"),
+            contracts,
+            max_workers,
+            root,
+            start_date=start_date,
+            end_date=end_date,
+            ivl=ivl,
+            rth=rth,
+            start_time=start_time,
+            end_time=end_time,
+            write_csv=write_csv,
+        )
+
+    def get_historical_ohlc_many(
+        self,
+        root: str,
+        contracts: list[tuple[str, int, str]],
+        start_date: str,
+        end_date: str,
+        ivl: int,
+        rth: bool = True,
+        start_time: str = None,
+        end_time: str = None,
+        write_csv: bool = False,
+        max_workers: int = 16,
+    ) -> pd.DataFrame | None:
+        """
+        Get historical OHLC data for several option contracts concurrently.
+
+        Each contract is requested with get_historical_ohlc from a thread pool.
+
+        Args:
+            root (str): The symbol of the security. Option underlyings for indices might have special tickers.
+            contracts (list[tuple[str, int, str]]): (exp, strike, right) for each contract, as for get_historical_ohlc.
+            start_date (str): The start date (inclusive) of the request formatted as YYYYMMDD.
+            end_date (str): The end date (inclusive) of the request formatted as YYYYMMDD.
+            ivl (int): The interval size in milliseconds. Must be between 100 and 3600000.
+            rth (bool, optional): If False, include data outside regular trading hours. Defaults to True.
+            start_time (str, optional): If specified, include all ticks on or after this time.
+            end_time (str, optional): If specified, include all ticks on or before this time.
+            write_csv (bool, optional): If True, write one CSV file per contract. Defaults to False.
+            max_workers (int, optional): The maximum number of requests in flight at once. Defaults to 16.
+
+        Returns:
+            pd.DataFrame | None: The get_historical_ohlc columns plus exp, strike and right, or None if every request fails
+
+        Raises:
+            ValueError: If invalid parameters are provided.
+        """
+        return _map_parallel(
+            self.get_historical_ohlc,
+            ("exp", "strike", "right"),
+            contracts,
+            max_workers,
+            root,
+            start_date=start_date,
+            end_date=end_date,
+            ivl=ivl,
+            rth=rth,
+            start_time=start_time,
+            end_time=end_time,
+            write_csv=write_csv,
+        )
+
     def get_historical_open_interest(
         self,
         root: str,
@@ -526,7 +767,7 @@ class ThetaDataOptions(ThetaDataBase):
             open_interest: The total amount of outstanding contracts.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting historical open interest for {root} option")
+        self.logger.info("Getting historical open interest for %s option", root)
         endpoint = "/v2/hist/option/open_interest"
 
         if not is_valid_right(right):
@@ -605,7 +846,7 @@ class ThetaDataOptions(ThetaDataBase):
             records_back: Non-zero for trade cancellations and insertions. The value represents the amount of trades prior to the current trade to delete or insert.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting historical trades for {root} option")
+        self.logger.info("Getting historical trades for %s option", root)
         endpoint = "/v2/hist/option/trade"
 
         if not is_valid_right(right):
@@ -618,7 +859,7 @@ class ThetaDataOptions(ThetaDataBase):
             "right": right,
             "start_date": start_date,
             "end_date": end_date,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         if start_time:
@@ -693,7 +934,7 @@ class ThetaDataOptions(ThetaDataBase):
             ask_condition: The last NBBO ask condition.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting historical trade-quote data for {root} option")
+        self.logger.info("Getting historical trade-quote data for %s option", root)
         endpoint = "/v2/hist/option/trade_quote"
 
         if not is_valid_right(right):
@@ -706,9 +947,9 @@ class ThetaDataOptions(ThetaDataBase):
             "right": right,
             "start_date": start_date,
             "end_date": end_date,
-            "exclusive": str(exclusive).lower(),
-            "rth": str(rth).lower(),
-            "use_csv": str(use_csv).lower(),
+            "exclusive": _BOOL_STR[exclusive],
+            "rth": _BOOL_STR[rth],
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -756,6 +997,7 @@ class ThetaDataOptions(ThetaDataBase):
         Note:
             - Requires a Theta Data Options Standard subscription.
             - The Theta Terminal must be running to make this request.
+            - For every strike of an expiration, one get_bulk_implied_volatility request replaces a loop over this method.
 
         Output columns:
             ms_of_day: The exchange timestamp or interval time of the option quote. Milliseconds since 00:00:00.000 (midnight) ET.
@@ -771,28 +1013,24 @@ class ThetaDataOptions(ThetaDataBase):
             date: The date formatted as YYYYMMDD.
         """
         self.logger.info(
-            f"Getting historical implied volatility data for {root} option"
+            "Getting historical implied volatility data for %s option", root
         )
         endpoint = "/v2/hist/option/implied_volatility"
 
-        if not is_valid_right(right):
-            raise ValueError("right must be either 'C' or 'P'")
-
+        params = _contract_params(
+            root,
+            exp,
+            strike,
+            right,
+            start_date,
+            end_date,
+            ivl=ivl,
+            rth=_BOOL_STR[rth],
+            use_csv=_BOOL_STR[use_csv],
+        )
         if not is_valid_ivl(ivl):
             raise ValueError("ivl must be between 100 and 3600000")
 
-        params = {
-            "root": root,
-            "exp": exp,
-            "strike": strike,
-            "right": right,
-            "start_date": start_date,
-            "end_date": end_date,
-            "ivl": ivl,
-            "rth": str(rth).lower(),
-            "use_csv": str(use_csv).lower(),
-        }
-
         response = self.send_request(endpoint, params)
         return self._process_response(
             response,
@@ -838,6 +1076,7 @@ class ThetaDataOptions(ThetaDataBase):
         Note:
             - Requires a Theta Data Options Standard subscription.
             - The Theta Terminal must be running to make this request.
+            - For every strike of an expiration, one get_bulk_greeks request replaces a loop over this method.
 
         Output columns:
             ms_of_day: The exchange timestamp or interval time of the option quote. Milliseconds since 00:00:00.000 (midnight) ET.
@@ -855,27 +1094,23 @@ class ThetaDataOptions(ThetaDataBase):
             underlying_price: The midpoint of the underlying at the time of the option quote.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting historical Greeks data for {root} option")
+        self.logger.info("Getting historical Greeks data for %s option", root)
         endpoint = "/v2/hist/option/greeks"
 
-        if not is_valid_right(right):
-            raise ValueError("right must be either 'C' or 'P'")
-
+        params = _contract_params(
+            root,
+            exp,
+            strike,
+            right,
+            start_date,
+            end_date,
+            ivl=ivl,
+            rth=_BOOL_STR[rth],
+            use_csv=_BOOL_STR[use_csv],
+        )
         if ivl != 0 and not is_valid_ivl(ivl):
             raise ValueError("ivl must be between 100 and 3600000")
 
-        params = {
-            "root": root,
-            "exp": exp,
-            "strike": strike,
-            "right": right,
-            "start_date": start_date,
-            "end_date": end_date,
-            "ivl": ivl,
-            "rth": str(rth).lower(),
-            "use_csv": str(use_csv).lower(),
-        }
-
         response = self.send_request(endpoint, params)
         return self._process_response(
             response,
@@ -938,28 +1173,24 @@ class ThetaDataOptions(ThetaDataBase):
             date: The date formatted as YYYYMMDD.
         """
         self.logger.info(
-            f"Getting historical second-order Greeks data for {root} option"
+            "Getting historical second-order Greeks data for %s option", root
         )
         endpoint = "/v2/hist/option/greeks_second_order"
 
-        if not is_valid_right(right):
-            raise ValueError("right must be either 'C' or 'P'")
-
+        params = _contract_params(
+            root,
+            exp,
+            strike,
+            right,
+            start_date,
+            end_date,
+            ivl=ivl,
+            rth=_BOOL_STR[rth],
+            use_csv=_BOOL_STR[use_csv],
+        )
         if ivl != 0 and not is_valid_ivl(ivl):
             raise ValueError("ivl must be between 100 and 3600000")
 
-        params = {
-            "root": root,
-            "exp": exp,
-            "strike": strike,
-            "right": right,
-            "start_date": start_date,
-            "end_date": end_date,
-            "ivl": ivl,
-            "rth": str(rth).lower(),
-            "use_csv": str(use_csv).lower(),
-        }
-
         response = self.send_request(endpoint, params)
         return self._process_response(
             response,
@@ -1021,28 +1252,24 @@ class ThetaDataOptions(ThetaDataBase):
             date: The date formatted as YYYYMMDD.
         """
         self.logger.info(
-            f"Getting historical third-order Greeks data for {root} option"
+            "Getting historical third-order Greeks data for %s option", root
         )
         endpoint = "/v2/hist/option/greeks_third_order"
 
-        if not is_valid_right(right):
-            raise ValueError("right must be either 'C' or 'P'")
-
+        params = _contract_params(
+            root,
+            exp,
+            strike,
+            right,
+            start_date,
+            end_date,
+            ivl=ivl,
+            rth=_BOOL_STR[rth],
+            use_csv=_BOOL_STR[use_csv],
+        )
         if ivl != 0 and not is_valid_ivl(ivl):
             raise ValueError("ivl must be between 100 and 3600000")
 
-        params = {
-            "root": root,
-            "exp": exp,
-            "strike": strike,
-            "right": right,
-            "start_date": start_date,
-            "end_date": end_date,
-            "ivl": ivl,
-            "rth": str(rth).lower(),
-            "use_csv": str(use_csv).lower(),
-        }
-
         response = self.send_request(endpoint, params)
         return self._process_response(
             response,
@@ -1094,27 +1321,23 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would be here, but they are not provided in the original docstring]
         """
-        self.logger.info(f"Getting historical all Greeks data for {root} option")
+        self.logger.info("Getting historical all Greeks data for %s option", root)
         endpoint = "/v2/hist/option/all_greeks"
 
-        if not is_valid_right(right):
-            raise ValueError("right must be either 'C' or 'P'")
-
+        params = _contract_params(
+            root,
+            exp,
+            strike,
+            right,
+            start_date,
+            end_date,
+            ivl=ivl,
+            rth=_BOOL_STR[rth],
+            use_csv=_BOOL_STR[use_csv],
+        )
         if ivl != 0 and not is_valid_ivl(ivl):
             raise ValueError("ivl must be between 100 and 3600000")
 
-        params = {
-            "root": root,
-            "exp": exp,
-            "strike": strike,
-            "right": right,
-            "start_date": start_date,
-            "end_date": end_date,
-            "ivl": ivl,
-            "rth": str(rth).lower(),
-            "use_csv": str(use_csv).lower(),
-        }
-
         response = self.send_request(endpoint, params)
         return self._process_response(
             response,
@@ -1185,22 +1408,19 @@ class ThetaDataOptions(ThetaDataBase):
             underlying_price: The midpoint of the underlying at the time of the option trade.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting historical trade Greeks data for {root} option")
+        self.logger.info("Getting historical trade Greeks data for %s option", root)
         endpoint = "/v2/hist/option/trade_greeks"
 
-        if not is_valid_right(right):
-            raise ValueError("right must be either 'C' or 'P'")
-
-        params = {
-            "root": root,
-            "exp": exp,
-            "strike": strike,
-            "right": right,
-            "start_date": start_date,
-            "end_date": end_date,
-            "perf_boost": str(perf_boost).lower(),
-            "use_csv": str(use_csv).lower(),
-        }
+        params = _contract_params(
+            root,
+            exp,
+            strike,
+            right,
+            start_date,
+            end_date,
+            perf_boost=_BOOL_STR[perf_boost],
+            use_csv=_BOOL_STR[use_csv],
+        )
 
         response = self.send_request(endpoint, params)
         return self._process_response(
@@ -1270,23 +1490,20 @@ class ThetaDataOptions(ThetaDataBase):
             date: The date formatted as YYYYMMDD.
         """
         self.logger.info(
-            f"Getting historical trade Greeks second order data for {root} option"
+            "Getting historical trade Greeks second order data for %s option", root
         )
         endpoint = "/v2/hist/option/trade_greeks_second_order"
 
-        if not is_valid_right(right):
-            raise ValueError("right must be either 'C' or 'P'")
-
-        params = {
-            "root": root,
-            "exp": exp,
-            "strike": strike,
-            "right": right,
-            "start_date": start_date,
-            "end_date": end_date,
-            "perf_boost": str(perf_boost).lower(),
-            "use_csv": str(use_csv).lower(),
-        }
+        params = _contract_params(
+            root,
+            exp,
+            strike,
+            right,
+            start_date,
+            end_date,
+            perf_boost=_BOOL_STR[perf_boost],
+            use_csv=_BOOL_STR[use_csv],
+        )
 
         response = self.send_request(endpoint, params)
         return self._process_response(
@@ -1355,23 +1572,20 @@ class ThetaDataOptions(ThetaDataBase):
             date: The date formatted as YYYYMMDD.
         """
         self.logger.info(
-            f"Getting historical trade Greeks third order data for {root} option"
+            "Getting historical trade Greeks third order data for %s option", root
         )
         endpoint = "/v2/hist/option/trade_greeks_third_order"
 
-        if not is_valid_right(right):
-            raise ValueError("right must be either 'C' or 'P'")
-
-        params = {
-            "root": root,
-            "exp": exp,
-            "strike": strike,
-            "right": right,
-            "start_date": start_date,
-            "end_date": end_date,
-            "perf_boost": str(perf_boost).lower(),
-            "use_csv": str(use_csv).lower(),
-        }
+        params = _contract_params(
+            root,
+            exp,
+            strike,
+            right,
+            start_date,
+            end_date,
+            perf_boost=_BOOL_STR[perf_boost],
+            use_csv=_BOOL_STR[use_csv],
+        )
 
         response = self.send_request(endpoint, params)
         return self._process_response(
@@ -1440,7 +1654,7 @@ class ThetaDataOptions(ThetaDataBase):
             ask_condition: The last NBBO ask condition.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting bulk EOD data for {root} options")
+        self.logger.info("Getting bulk EOD data for %s options", root)
         endpoint = "/v2/bulk_hist/option/eod"
 
         params = {
@@ -1450,7 +1664,7 @@ class ThetaDataOptions(ThetaDataBase):
             "end_date": end_date,
             "annual_div": annual_div,
             "rate": rate,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         if rate_value is not None:
@@ -1513,7 +1727,7 @@ class ThetaDataOptions(ThetaDataBase):
             ask_condition: The last NBBO ask condition.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting bulk quote data for {root} options")
+        self.logger.info("Getting bulk quote data for %s options", root)
         endpoint = "/v2/bulk_hist/option/quote"
 
         if not is_valid_ivl(ivl):
@@ -1525,7 +1739,7 @@ class ThetaDataOptions(ThetaDataBase):
             "start_date": start_date,
             "end_date": end_date,
             "ivl": ivl,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         if start_time:
@@ -1585,7 +1799,7 @@ class ThetaDataOptions(ThetaDataBase):
             count: The amount of trades.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting bulk OHLC data for {root} options")
+        self.logger.info("Getting bulk OHLC data for %s options", root)
         endpoint = "/v2/bulk_hist/option/ohlc"
 
         if not is_valid_ivl(ivl):
@@ -1597,7 +1811,7 @@ class ThetaDataOptions(ThetaDataBase):
             "start_date": start_date,
             "end_date": end_date,
             "ivl": ivl,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         if start_time:
@@ -1648,7 +1862,7 @@ class ThetaDataOptions(ThetaDataBase):
             open_interest: The total amount of outstanding contracts.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting bulk open interest data for {root} options")
+        self.logger.info("Getting bulk open interest data for %s options", root)
         endpoint = "/v2/bulk_hist/option/open_interest"
 
         params = {
@@ -1656,7 +1870,7 @@ class ThetaDataOptions(ThetaDataBase):
             "exp": exp,
             "start_date": start_date,
             "end_date": end_date,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -1711,7 +1925,7 @@ class ThetaDataOptions(ThetaDataBase):
             conditions: The trade conditions.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting bulk trade data for {root} options")
+        self.logger.info("Getting bulk trade data for %s options", root)
         endpoint = "/v2/bulk_hist/option/trade"
 
         params = {
@@ -1719,7 +1933,7 @@ class ThetaDataOptions(ThetaDataBase):
             "exp": exp,
             "start_date": start_date,
             "end_date": end_date,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         if ivl is not None:
@@ -1737,6 +1951,104 @@ class ThetaDataOptions(ThetaDataBase):
             response, write_csv, "bulk_option_trade", f"{root}_{exp}"
         )
 
+    def get_bulk_quote_many(
+        self,
+        pairs: list[tuple[str, str]],
+        start_date: str,
+        end_date: str,
+        ivl: int,
+        start_time: str = None,
+        end_time: str = None,
+        use_csv: bool = False,
+        write_csv: bool = False,
+        max_workers: int = 8,
+    ) -> pd.DataFrame | None:
+        """
+        Get bulk quote data for several roots and expirations concurrently.
+
+        Each (root, exp) pair is requested with get_bulk_quote from a thread pool.
+
+        Args:
+            pairs (list[tuple[str, str]]): (root, exp) for each request, as for get_bulk_quote.
+            start_date (str): The start date (inclusive) of the request formatted as YYYYMMDD.
+            end_date (str): The end date (inclusive) of the request formatted as YYYYMMDD.
+            ivl (int): The interval size in milliseconds. Must be between 100 and 3600000.
+            start_time (str, optional): If specified, include all ticks on or after this time.
+            end_time (str, optional): If specified, include all ticks on or before this time.
+            use_csv (bool, optional): If True, request CSV responses instead of JSON. Defaults to False.
+            write_csv (bool, optional): If True, write one CSV file per pair. Defaults to False.
+            max_workers (int, optional): The maximum number of requests in flight at once. Keep it within the
+                client's pool_maxsize. Defaults to 8.
+
+        Returns:
+            pd.DataFrame | None: The get_bulk_quote columns plus root and exp, or None if every request fails
+
+        Raises:
+            ValueError: If invalid parameters are provided.
+        """
+        return _map_parallel(
+            self.get_bulk_quote,
+            ("root", "exp"),
+            pairs,
+            max_workers,
+            start_date=start_date,
+            end_date=end_date,
+            ivl=ivl,
+            start_time=start_time,
+            end_time=end_time,
+            use_csv=use_csv,
+            write_csv=write_csv,
+        )
+
+    def get_bulk_trade_many(
+        self,
+        pairs: list[tuple[str, str]],
+        start_date: str,
+        end_date: str,
+        ivl: int = None,
+        start_time: str = None,
+        end_time: str = None,
+        use_csv: bool = False,
+        write_csv: bool = False,
+        max_workers: int = 8,
+    ) -> pd.DataFrame | None:
+        """
+        Get bulk trade data for several roots and expirations concurrently.
+
+        Each (root, exp) pair is requested with get_bulk_trade from a thread pool.
+
+        Args:
+            pairs (list[tuple[str, str]]): (root, exp) for each request, as for get_bulk_trade.
+            start_date (str): The start date (inclusive) of the request formatted as YYYYMMDD.
+            end_date (str): The end date (inclusive) of the request formatted as YYYYMMDD.
+            ivl (int, optional): The interval size in milliseconds, as for get_bulk_trade.
+            start_time (str, optional): If specified, include all ticks on or after this time.
+            end_time (str, optional): If specified, include all ticks on or before this time.
+            use_csv (bool, optional): If True, request CSV responses instead of JSON. Defaults to False.
+            write_csv (bool, optional): If True, write one CSV file per pair. Defaults to False.
+            max_workers (int, optional): The maximum number of requests in flight at once. Keep it within the
+                client's pool_maxsize. Defaults to 8.
+
+        Returns:
+            pd.DataFrame | None: The get_bulk_trade columns plus root and exp, or None if every request fails
+
+        Raises:
+            ValueError: If invalid parameters are provided.
+        """
+        return _map_parallel(
+            self.get_bulk_trade,
+            ("root", "exp"),
+            pairs,
+            max_workers,
+            start_date=start_date,
+            end_date=end_date,
+            ivl=ivl,
+            start_time=start_time,
+            end_time=end_time,
+            use_csv=use_csv,
+            write_csv=write_csv,
+        )
+
     def get_bulk_trade_quote(
         self,
         root: str,
@@ -1794,7 +2106,7 @@ class ThetaDataOptions(ThetaDataBase):
             ask_condition: The last NBBO ask condition.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting bulk trade and quote data for {root} options")
+        self.logger.info("Getting bulk trade and quote data for %s options", root)
         endpoint = "/v2/bulk_hist/option/trade_quote"
 
         params = {
@@ -1802,8 +2114,8 @@ class ThetaDataOptions(ThetaDataBase):
             "exp": exp,
             "start_date": start_date,
             "end_date": end_date,
-            "exclusive": str(exclusive).lower(),
-            "use_csv": str(use_csv).lower(),
+            "exclusive": _BOOL_STR[exclusive],
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -1854,7 +2166,7 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would go here, based on the actual API response]
         """
-        self.logger.info(f"Getting bulk EOD Greeks data for {root} options")
+        self.logger.info("Getting bulk EOD Greeks data for %s options", root)
         endpoint = "/v2/bulk_hist/option/eod_greeks"
 
         params = {
@@ -1862,7 +2174,7 @@ class ThetaDataOptions(ThetaDataBase):
             "exp": exp,
             "start_date": start_date,
             "end_date": end_date,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         if annual_div is not None:
@@ -1924,7 +2236,7 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would go here, based on the actual API response]
         """
-        self.logger.info(f"Getting bulk trade Greeks data for {root} options")
+        self.logger.info("Getting bulk trade Greeks data for %s options", root)
         endpoint = "/v2/bulk_hist/option/trade_greeks"
 
         params = {
@@ -1932,8 +2244,8 @@ class ThetaDataOptions(ThetaDataBase):
             "exp": exp,
             "start_date": start_date,
             "end_date": end_date,
-            "use_csv": str(use_csv).lower(),
-            "perf_boost": str(perf_boost).lower(),
+            "use_csv": _BOOL_STR[use_csv],
+            "perf_boost": _BOOL_STR[perf_boost],
         }
 
         if annual_div is not None:
@@ -1950,6 +2262,126 @@ class ThetaDataOptions(ThetaDataBase):
             response, write_csv, "bulk_option_trade_greeks", f"{root}_{exp}"
         )
 
+    def get_bulk_greeks(
+        self,
+        root: str,
+        exp: str,
+        start_date: str,
+        end_date: str,
+        ivl: int,
+        rth: bool = True,
+        use_csv: bool = False,
+        write_csv: bool = False,
+    ) -> pd.DataFrame | None:
+        """
+        Get historical Greeks for all contracts with the same root and expiration.
+
+        One request covers the whole chain, replacing a loop of get_historical_greeks calls over every
+        strike and right.
+
+        Args:
+            root (str): The symbol of the security. Option underlyings for indices might have special tickers.
+            exp (str): The expiration date of the option contracts formatted as YYYYMMDD. Use '0' for all expirations.
+            start_date (str): The start date (inclusive) of the request formatted as YYYYMMDD.
+            end_date (str): The end date (inclusive) of the request formatted as YYYYMMDD.
+            ivl (int): The interval size in milliseconds. Must be between 100 and 3600000.
+            rth (bool, optional): If False, include data outside regular trading hours. Defaults to True.
+            use_csv (bool, optional): If True, request a CSV response instead of JSON, with one row per tick that
+                includes the contract's strike and right. Defaults to False.
+            write_csv (bool, optional): If True, write the DataFrame to a CSV file. Defaults to False.
+
+        Returns:
+            pd.DataFrame | None: DataFrame of bulk Greeks, or None if request fails
+
+        Raises:
+            ValueError: If invalid parameters are provided.
+
+        Note:
+            - Requires a Theta Data Options Standard subscription.
+            - The Theta Terminal must be running to make this request.
+            - The columns match get_historical_greeks.
+        """
+        self.logger.info("Getting bulk Greeks for %s options", root)
+        endpoint = "/v2/bulk_hist/option/greeks"
+
+        if not is_valid_ivl(ivl):
+            raise ValueError("ivl must be between 100 and 3600000")
+
+        params = {
+            "root": root,
+            "exp": exp,
+            "start_date": start_date,
+            "end_date": end_date,
+            "ivl": ivl,
+            "rth": _BOOL_STR[rth],
+            "use_csv": _BOOL_STR[use_csv],
+        }
+
+        response = self.send_request(endpoint, params)
+        return self._process_response(
+            response, write_csv, "bulk_option_greeks", f"{root}_{exp}"
+        )
+
+    def get_bulk_implied_volatility(
+        self,
+        root: str,
+        exp: str,
+        start_date: str,
+        end_date: str,
+        ivl: int = 900000,
+        rth: bool = True,
+        use_csv: bool = False,
+        write_csv: bool = False,
+    ) -> pd.DataFrame | None:
+        """
+        Get historical implied volatilities for all contracts with the same root and expiration.
+
+        One request covers the whole chain, replacing a loop of get_historical_implied_volatility calls over every
+        strike and right.
+
+        Args:
+            root (str): The symbol of the security. Option underlyings for indices might have special tickers.
+            exp (str): The expiration date of the option contracts formatted as YYYYMMDD. Use '0' for all expirations.
+            start_date (str): The start date (inclusive) of the request formatted as YYYYMMDD.
+            end_date (str): The end date (inclusive) of the request formatted as YYYYMMDD.
+            ivl (int, optional): The interval size in milliseconds. Defaults to 900000 (15 minutes).
+            rth (bool, optional): If False, include data outside regular trading hours. Defaults to True.
+            use_csv (bool, optional): If True, request a CSV response instead of JSON, with one row per tick that
+                includes the contract's strike and right. Defaults to False.
+            write_csv (bool, optional): If True, write the DataFrame to a CSV file. Defaults to False.
+
+        Returns:
+            pd.DataFrame | None: DataFrame of bulk implied volatilities, or None if request fails
+
+        Raises:
+            ValueError: If invalid parameters are provided.
+
+        Note:
+            - Requires a Theta Data Options Standard subscription.
+            - The Theta Terminal must be running to make this request.
+            - The columns match get_historical_implied_volatility.
+        """
+        self.logger.info("Getting bulk implied volatilities for %s options", root)
+        endpoint = "/v2/bulk_hist/option/implied_volatility"
+
+        if not is_valid_ivl(ivl):
+            raise ValueError("ivl must be between 100 and 3600000")
+
+        params = {
+            "root": root,
+            "exp": exp,
+            "start_date": start_date,
+            "end_date": end_date,
+            "ivl": ivl,
+            "rth": _BOOL_STR[rth],
+            "use_csv": _BOOL_STR[use_csv],
+        }
+
+        response = self.send_request(endpoint, params)
+        return self._process_response(
+            response, write_csv, "bulk_option_implied_volatility", f"{root}_{exp}"
+        )
+
     def get_quote_snapshot(
         self,
         root: str,
@@ -1985,7 +2417,7 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would go here, based on the actual API response]
         """
-        self.logger.info(f"Getting quote snapshot for {root} option")
+        self.logger.info("Getting quote snapshot for %s option", root)
         endpoint = "/v2/snapshot/option/quote"
 
         if not is_valid_right(right):
@@ -1996,7 +2428,7 @@ class ThetaDataOptions(ThetaDataBase):
             "exp": exp,
             "right": right,
             "strike": strike,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -2042,7 +2474,7 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would go here, based on the actual API response]
         """
-        self.logger.info(f"Getting OHLC snapshot for {root} option")
+        self.logger.info("Getting OHLC snapshot for %s option", root)
         endpoint = "/v2/snapshot/option/ohlc"
 
         if not is_valid_right(right):
@@ -2053,7 +2485,7 @@ class ThetaDataOptions(ThetaDataBase):
             "exp": exp,
             "right": right,
             "strike": strike,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -2099,7 +2531,7 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would go here, based on the actual API response]
         """
-        self.logger.info(f"Getting trade snapshot for {root} option")
+        self.logger.info("Getting trade snapshot for %s option", root)
         endpoint = "/v2/snapshot/option/trade"
 
         if not is_valid_right(right):
@@ -2110,7 +2542,7 @@ class ThetaDataOptions(ThetaDataBase):
             "exp": exp,
             "right": right,
             "strike": strike,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -2157,7 +2589,7 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would go here, based on the actual API response]
         """
-        self.logger.info(f"Getting open interest snapshot for {root} option")
+        self.logger.info("Getting open interest snapshot for %s option", root)
         endpoint = "/v2/snapshot/option/open_interest"
 
         if not is_valid_right(right):
@@ -2168,7 +2600,7 @@ class ThetaDataOptions(ThetaDataBase):
             "exp": exp,
             "right": right,
             "strike": strike,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -2210,13 +2642,13 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would go here, based on the actual API response]
         """
-        self.logger.info(f"Getting bulk quotes snapshot for {root} options")
+        self.logger.info("Getting bulk quotes snapshot for %s options", root)
         endpoint = "/v2/bulk_snapshot/option/quote"
 
         params = {
             "root": root,
             "exp": exp,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -2255,13 +2687,13 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would go here, based on the actual API response]
         """
-        self.logger.info(f"Getting bulk open interest snapshot for {root} options")
+        self.logger.info("Getting bulk open interest snapshot for %s options", root)
         endpoint = "/v2/bulk_snapshot/option/open_interest"
 
         params = {
             "root": root,
             "exp": exp,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -2300,13 +2732,13 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would go here, based on the actual API response]
         """
-        self.logger.info(f"Getting bulk OHLC snapshot for {root} options")
+        self.logger.info("Getting bulk OHLC snapshot for %s options", root)
         endpoint = "/v2/bulk_snapshot/option/ohlc"
 
         params = {
             "root": root,
             "exp": exp,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         response = self.send_request(endpoint, params)
@@ -2353,13 +2785,13 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would go here, based on the actual API response]
         """
-        self.logger.info(f"Getting bulk Greeks snapshot for {root} options")
+        self.logger.info("Getting bulk Greeks snapshot for %s options", root)
         endpoint = "/v2/bulk_snapshot/option/greeks"
 
         params = {
             "root": root,
             "exp": exp,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         if annual_div is not None:
@@ -2416,14 +2848,14 @@ class ThetaDataOptions(ThetaDataBase):
             [List of output columns would go here, based on the actual API response]
         """
         self.logger.info(
-            f"Getting bulk second order Greeks snapshot for {root} options"
+            "Getting bulk second order Greeks snapshot for %s options", root
         )
         endpoint = "/v2/bulk_snapshot/option/greeks_second_order"
 
         params = {
             "root": root,
             "exp": exp,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         if annual_div is not None:
@@ -2482,13 +2914,15 @@ class ThetaDataOptions(ThetaDataBase):
         Output columns:
             [List of output columns would go here, based on the actual API response]
         """
-        self.logger.info(f"Getting bulk third order Greeks snapshot for {root} options")
+        self.logger.info(
+            "Getting bulk third order Greeks snapshot for %s options", root
+        )
         endpoint = "/v2/bulk_snapshot/option/greeks_third_order"
 
         params = {
             "root": root,
             "exp": exp,
-            "use_csv": str(use_csv).lower(),
+            "use_csv": _BOOL_STR[use_csv],
         }
 
         if annual_div is not None:
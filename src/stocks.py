@@ -3,17 +3,21 @@ import pandas as pd
 
 
 class ThetaDataStocksSnapshot(ThetaDataBase):
-    def __init__(self, log_level: str = "WARNING", output_dir: str = "./") -> None:
+    def __init__(
+        self, log_level: str | None = None, output_dir: str = "./", **kwargs
+    ) -> None:
         """
         Initialize the ThetaDataStocksSnapshot class.
 
         Parameters:
-        log_level (str): The logging level. Defaults to "WARNING".
+        log_level (str | None): The level of the library logger, shared by all clients. Defaults to None,
+            which leaves it to the application's logging configuration.
         output_dir (str): The directory to save output files. Defaults to "./".
+        **kwargs: Additional options passed to ThetaDataBase (e.g. cache_dir, output_format).
 
         This constructor sets up logging and initializes the output directory.
         """
-        super().__init__(log_level, output_dir)
+        super().__init__(log_level, output_dir, **kwargs)
 
     def get_quotes(
         self, symbol: str, venue: str = None, write_csv: bool = False
@@ -41,7 +45,7 @@ class ThetaDataStocksSnapshot(ThetaDataBase):
             ask_condition: The last BBO ask condition.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting quotes for {symbol}")
+        self.logger.info("Getting quotes for %s", symbol)
         endpoint = "/v2/snapshot/stock/quote"
         params = {"root": symbol}
         if venue:
@@ -77,7 +81,7 @@ class ThetaDataStocksSnapshot(ThetaDataBase):
             ask_condition: The last BBO ask condition.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting bulk quotes for {symbols}")
+        self.logger.info("Getting bulk quotes for %s", symbols)
         endpoint = "/v2/snapshot/stock/quote"
         params = {"root": ",".join(symbols)}
         if venue:
@@ -110,7 +114,7 @@ class ThetaDataStocksSnapshot(ThetaDataBase):
             count: The amount of trades.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting OHLC for {symbol}")
+        self.logger.info("Getting OHLC for %s", symbol)
         endpoint = "/v2/snapshot/stock/ohlc"
         params = {"root": symbol}
         response = self.send_request(endpoint, params)
@@ -139,7 +143,7 @@ class ThetaDataStocksSnapshot(ThetaDataBase):
             count: The amount of trades.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting bulk OHLC for {symbols}")
+        self.logger.info("Getting bulk OHLC for %s", symbols)
         endpoint = "/v2/snapshot/stock/ohlc"
         params = {"root": ",".join(symbols)}
         response = self.send_request(endpoint, params)
@@ -175,7 +179,7 @@ class ThetaDataStocksSnapshot(ThetaDataBase):
             records_back: Non-zero for trade cancellations and insertions. The value represents the amount of trades prior to the current trade to delete or insert.
             date: The date formatted as YYYYMMDD.
         """
-        self.logger.info(f"Getting trades for {symbol}")
+        self.logger.info("Getting trades for %s", symbol)
         endpoint = "/v2/snapshot/stock/trade"
         params = {"root": symbol}
         response = self.send_request(endpoint, params)
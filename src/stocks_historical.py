@@ -1,22 +1,25 @@
 import pandas as pd
-import os
 
 from .utils import is_valid_date_format
 from .base import ThetaDataBase
 
 
 class ThetaDataStocksHistorical(ThetaDataBase):
-    def __init__(self, log_level: str = "WARNING", output_dir: str = "./") -> None:
+    def __init__(
+        self, log_level: str | None = None, output_dir: str = "./", **kwargs
+    ) -> None:
         """
         Initialize the ThetaDataStocksHistorical class.
 
         Parameters:
-        log_level (str): The logging level. Defaults to "WARNING".
+        log_level (str | None): The level of the library logger, shared by all clients. Defaults to None,
+            which leaves it to the application's logging configuration.
         output_dir (str): The directory to save output files. Defaults to "./".
+        **kwargs: Additional options passed to ThetaDataBase (e.g. cache_dir, output_format).
 
         This constructor sets up logging and initializes the output directory.
         """
-        super().__init__(log_level, output_dir)
+        super().__init__(log_level, output_dir, **kwargs)
 
     def _process_response(
         self,
@@ -41,44 +44,9 @@ class ThetaDataStocksHistorical(ThetaDataBase):
         Returns:
             pd.DataFrame | None: DataFrame of data, or None if response is None.
         """
-        if response:
-            columns = response["header"]["format"]
-            data = response["response"]
-            df = pd.DataFrame(data, columns=columns)
-
-            if write_csv:
-                self._write_csv(df, datatype, symbol, start_date, end_date)
-
-            return df
-        else:
-            return None
-
-    def _write_csv(
-        self,
-        df: pd.DataFrame,
-        datatype: str,
-        symbol: str,
-        start_date: str,
-        end_date: str,
-    ) -> None:
-        """
-        Write DataFrame to CSV file.
-
-        Args:
-            df (pd.DataFrame): DataFrame to write
-            datatype (str): Type of data (e.g., 'eod', 'quotes', 'ohlc')
-            symbol (str): The stock symbol
-            start_date (str): Start date in 'YYYYMMDD' format
-            end_date (str): End date in 'YYYYMMDD' format
-        """
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-            self.logger.info(f"Created output directory: {self.output_dir}")
-
-        filename = f"{datatype}_{symbol}_{start_date}_{end_date}.csv"
-        filepath = os.path.join(self.output_dir, filename)
-        df.to_csv(filepath, index=False)
-        self.logger.info(f"CSV file written: {filepath}")
+        return super()._process_response(
+            response, write_csv, datatype, f"{symbol}_{start_date}_{end_date}"
+        )
 
     def get_eod_report(
         self, symbol: str, start_date: str, end_date: str, write_csv: bool = False
@@ -117,12 +85,14 @@ class ThetaDataStocksHistorical(ThetaDataBase):
         # Check if dates have the correct format
         if not (is_valid_date_format(start_date) and is_valid_date_format(end_date)):
             self.logger.error(
-                f"Invalid date format. Expected format: 'YYYYMMDD'. Got start_date: {start_date}, end_date: {end_date}"
+                "Invalid date format. Expected format: 'YYYYMMDD'. Got start_date: %s, end_date: %s",
+                start_date,
+                end_date,
             )
             return None
 
         self.logger.info(
-            f"Getting EOD report for {symbol} from {start_date} to {end_date}"
+            "Getting EOD report for %s from %s to %s", symbol, start_date, end_date
         )
         endpoint = "/v2/hist/stock/eod"
         params = {"root": symbol, "start_date": start_date, "end_date": end_date}
@@ -164,7 +134,9 @@ class ThetaDataStocksHistorical(ThetaDataBase):
         Returns:
             pd.DataFrame | None: DataFrame of quote data, or None if request fails
         """
-        self.logger.info(f"Getting quotes for {symbol} from {start_date} to {end_date}")
+        self.logger.info(
+            "Getting quotes for %s from %s to %s", symbol, start_date, end_date
+        )
         endpoint = "/v2/hist/stock/quote"
         params = {
             "root": symbol,
@@ -208,7 +180,9 @@ class ThetaDataStocksHistorical(ThetaDataBase):
         Returns:
             pd.DataFrame | None: DataFrame of OHLC data, or None if request fails
         """
-        self.logger.info(f"Getting OHLC for {symbol} from {start_date} to {end_date}")
+        self.logger.info(
+            "Getting OHLC for %s from %s to %s", symbol, start_date, end_date
+        )
         endpoint = "/v2/hist/stock/ohlc"
         params = {
             "root": symbol,
@@ -253,7 +227,9 @@ class ThetaDataStocksHistorical(ThetaDataBase):
         Returns:
             pd.DataFrame | None: DataFrame of trade data, or None if request fails
         """
-        self.logger.info(f"Getting trades for {symbol} from {start_date} to {end_date}")
+        self.logger.info(
+            "Getting trades for %s from %s to %s", symbol, start_date, end_date
+        )
         endpoint = "/v2/hist/stock/trade"
         params = {
             "root": symbol,
@@ -307,7 +283,7 @@ class ThetaDataStocksHistorical(ThetaDataBase):
             pd.DataFrame | None: DataFrame of trade and quote data, or None if request fails
         """
         self.logger.info(
-            f"Getting trade quotes for {symbol} from {start_date} to {end_date}"
+            "Getting trade quotes for %s from %s to %s", symbol, start_date, end_date
         )
         endpoint = "/v2/hist/stock/trade_quote"
         params = {
@@ -342,7 +318,9 @@ class ThetaDataStocksHistorical(ThetaDataBase):
         Returns:
             pd.DataFrame | None: DataFrame of stock split data, or None if request fails
         """
-        self.logger.info(f"Getting splits for {symbol} from {start_date} to {end_date}")
+        self.logger.info(
+            "Getting splits for %s from %s to %s", symbol, start_date, end_date
+        )
         endpoint = "/v2/hist/stock/split"
         params = {
             "root": symbol,
@@ -381,7 +359,7 @@ class ThetaDataStocksHistorical(ThetaDataBase):
             pd.DataFrame | None: DataFrame of dividend data, or None if request fails
         """
         self.logger.info(
-            f"Getting dividends for {symbol} from {start_date} to {end_date}"
+            "Getting dividends for %s from %s to %s", symbol, start_date, end_date
         )
         endpoint = "/v2/hist/stock/dividend"
         params = {
@@ -1,10 +1,18 @@
+import re
+
+# Compiled once; re.ASCII keeps non-ASCII digits such as '²' from matching.
+_DATE_PATTERN = re.compile(r"\d{8}", re.ASCII)
+
+_RIGHTS = frozenset(("C", "P"))
+
+
 def is_valid_date_format(date_string: str) -> bool:
-    return len(date_string) == 8 and date_string.isdigit()
+    return _DATE_PATTERN.fullmatch(date_string) is not None
 
 
 def is_valid_right(right: str) -> bool:
     """Check if option type is valid('C' for call or 'P' for put)."""
-    return right in ["C", "P"]
+    return right in _RIGHTS
 
 
 def is_valid_ivl(ivl: int) -> bool:
@@ -0,0 +1,555 @@
+import datetime
+import gc
+import io
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+import pytest
+import pandas as pd
+import requests
+from unittest.mock import Mock, patch
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+from src.base import (
+    BASE_URL,
+    OPEN_RANGE_CACHE_TTL,
+    RETRY,
+    ThetaDataBase,
+    _background_clients,
+    _frame_from_rows,
+)
+
+
+@pytest.fixture
+def cached_client(tmp_path):
+    return ThetaDataBase(log_level="WARNING", output_dir="./", cache_dir=str(tmp_path))
+
+
+def test_send_request_cache_hit(cached_client):
+    mock_response = {"header": {"format": ["date"]}, "response": [[20240101]]}
+    params = {"root": "AAPL", "start_date": "20240101", "end_date": "20240102"}
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.content = json.dumps(mock_response).encode()
+        first = cached_client.send_request("/v2/hist/stock/eod", params)
+        second = cached_client.send_request("/v2/hist/stock/eod", dict(params))
+
+    assert first == second == mock_response
+    assert mock_get.call_count == 1
+
+
+def test_cache_dir_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("THETADATA_CACHE_DIR", str(tmp_path))
+    assert ThetaDataBase().cache_dir == str(tmp_path)
+    assert ThetaDataBase(cache_dir="elsewhere").cache_dir == "elsewhere"
+
+    monkeypatch.delenv("THETADATA_CACHE_DIR")
+    assert ThetaDataBase().cache_dir is None
+
+
+def test_send_request_cache_keyed_by_params(cached_client):
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.content = json.dumps({"key": "value"}).encode()
+        cached_client.send_request("/v2/hist/stock/eod", {"end_date": "20240102"})
+        cached_client.send_request("/v2/hist/stock/eod", {"end_date": "20240103"})
+
+    assert mock_get.call_count == 2
+
+
+def test_send_request_cache_opt_out(cached_client, tmp_path):
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.content = json.dumps({"key": "value"}).encode()
+        for _ in range(2):
+            cached_client.send_request(
+                "/v2/hist/stock/eod", {"end_date": "20240102"}, use_cache=False
+            )
+
+    assert mock_get.call_count == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_write_cache_leaves_no_temporary_files(cached_client, tmp_path):
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.content = json.dumps({"key": "value"}).encode()
+        cached_client.send_request("/v2/hist/stock/eod", {"end_date": "20240102"})
+
+    assert [path.suffix for path in tmp_path.iterdir()] == [".json"]
+
+
+def test_send_request_caches_csv_as_arrow(cached_client, tmp_path):
+    pytest.importorskip("pyarrow")
+    params = {"root": "AAPL", "end_date": "20240102", "use_csv": "true"}
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.raw = io.BytesIO(b"ms_of_day,bid\n34200000,1.5\n")
+        first = cached_client.send_request("/v2/hist/option/quote", params)
+        second = cached_client.send_request("/v2/hist/option/quote", params)
+
+    assert mock_get.call_count == 1
+    assert [path.suffix for path in tmp_path.iterdir()] == [".arrow"]
+    assert second["table"].equals(first["table"])
+    df = cached_client._process_response(second, False, "quotes", "AAPL")
+    assert df.to_dict("list") == {"ms_of_day": [34200000], "bid": [1.5]}
+
+    df.loc[0, "bid"] = 2.0  # a memory-mapped cache hit still gives a writable frame
+    assert df.loc[0, "bid"] == 2.0
+
+
+def test_send_request_open_range_expires(cached_client, tmp_path):
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.content = json.dumps({"key": "value"}).encode()
+        cached_client.send_request("/v2/hist/stock/eod", {"end_date": "99991231"})
+        cached_client.send_request("/v2/hist/stock/eod", {"end_date": "99991231"})
+        assert mock_get.call_count == 1
+
+        # Age the cache entry past the open-range TTL
+        (cache_file,) = tmp_path.iterdir()
+        stale = time.time() - OPEN_RANGE_CACHE_TTL - 1
+        os.utime(cache_file, (stale, stale))
+        cached_client.send_request("/v2/hist/stock/eod", {"end_date": "99991231"})
+
+    assert mock_get.call_count == 2
+
+
+def test_send_request_failure_not_cached(cached_client, tmp_path):
+    with patch("requests.Session.get") as mock_get:
+        mock_get.side_effect = requests.RequestException("Test error")
+        result = cached_client.send_request(
+            "/v2/hist/stock/eod", {"end_date": "20240102"}
+        )
+
+    assert result is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_ttl_uses_new_york_date(cached_client):
+    # 02:00 UTC on Jan 3 is still the evening of Jan 2 in New York.
+    now = datetime.datetime(2024, 1, 3, 2, 0, tzinfo=datetime.timezone.utc)
+    with patch("src.base.datetime") as mock_datetime:
+        mock_datetime.datetime.now.side_effect = lambda tz: now.astimezone(tz)
+        ttl = cached_client._cache_ttl("/v2/hist/stock/eod", {"end_date": "20240102"})
+        closed = cached_client._cache_ttl(
+            "/v2/hist/stock/eod", {"end_date": "20240101"}
+        )
+
+    assert ttl == OPEN_RANGE_CACHE_TTL
+    assert closed is None
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [[34200000, 187.5, 20240102], [34200001, 187.25, 20240102]],
+        [[34200000, 187.5, None], [34200001, 187, 20240102]],
+        [[34200000.5, 187.5, 20240102]],
+        [[None, None, None]],
+        [[2**60, 187.5, 20240102]],
+        [[1.0, 5, 20240101], [2.0, 6, 20240102]],
+        [["34200000", "187.5", 20240102]],
+        [[True, 187.5, 20240102]],
+        [[2**63, 187.5, 20240102]],
+    ],
+)
+def test_frame_from_rows_matches_pandas(rows):
+    columns = ["ms_of_day", "bid", "date"]
+    expected = pd.DataFrame(rows, columns=columns)
+
+    pd.testing.assert_frame_equal(_frame_from_rows(rows, columns), expected)
+
+
+def test_frame_from_rows_empty():
+    df = _frame_from_rows([], ["ms_of_day", "bid", "right"])
+    df["bid"] = df["bid"].astype("float32")  # must not leak into the cached template
+
+    assert _frame_from_rows([], ["ms_of_day", "bid", "right"]).dtypes.to_dict() == {
+        "ms_of_day": "int64",
+        "bid": "float64",
+        "right": "object",
+    }
+
+
+def test_process_response_downcast():
+    response = {
+        "header": {"format": ["ms_of_day", "bid", "volume", "date", "right"]},
+        "response": [
+            [34200000, 187.5, 3_000_000_000, None, "C"],
+            [34200001, 187.25, 1, 1, "P"],
+        ],
+    }
+    df = ThetaDataBase(downcast=True)._process_response(response, False, "ohlc", "AAPL")
+
+    assert df.dtypes.to_dict() == {
+        "ms_of_day": "int32",
+        "bid": "float32",
+        "volume": "int64",
+        "date": "float64",
+        "right": "category",
+    }
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False])
+def test_send_request_csv_response(monkeypatch, use_pyarrow):
+    if not use_pyarrow:
+        monkeypatch.setattr("src.base.pa", None)
+    client = ThetaDataBase()
+    with patch("requests.Session.get") as mock_get:
+        body = "ms_of_day,bid,date\n34200000,1.5,20240102\n"
+        mock_get.return_value.text = body
+        mock_get.return_value.raw = io.BytesIO(body.encode())
+        response = client.send_request(
+            "/v2/hist/option/quote", {"root": "AAPL", "use_csv": "true"}
+        )
+    df = client._process_response(response, False, "quotes", "AAPL")
+
+    expected = _frame_from_rows(
+        [[34200000, 1.5, 20240102]], ["ms_of_day", "bid", "date"]
+    )
+    pd.testing.assert_frame_equal(df, expected)
+
+    # The frame is writable, like one built from a JSON response.
+    df.loc[0, "bid"] = 2.0
+    df.loc[0, "ms_of_day"] = 34200001
+    assert df.loc[0, "bid"] == 2.0
+
+
+def test_streamed_csv_response_closed_on_error():
+    pytest.importorskip("pyarrow")
+    client = ThetaDataBase()
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.raise_for_status.side_effect = requests.HTTPError("500")
+        response = client.send_request(
+            "/v2/hist/option/quote", {"root": "AAPL", "use_csv": "true"}
+        )
+
+    assert response is None
+    mock_get.return_value.__exit__.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "url, csv",
+    [
+        (BASE_URL + "/v2/hist/option/quote?root=AAPL&use_csv=true", True),
+        (BASE_URL + "/v2/hist/option/quote?root=AAPL&use_csv=trueish", False),
+        (BASE_URL + "/v2/hist/option/quote?note=use_csv=true", False),
+    ],
+)
+def test_get_detects_csv_from_url(monkeypatch, url, csv):
+    monkeypatch.setattr("src.base.pa", None)
+    client = ThetaDataBase()
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.text = "bid\n1.5\n"
+        mock_get.return_value.content = b'{"response": []}'
+        response = client._get(url)
+
+    assert ("csv" in response) is csv
+
+
+@pytest.mark.parametrize("downcast", [False, True])
+def test_process_response_add_timestamp(downcast):
+    response = {
+        "header": {"format": ["ms_of_day", "bid", "date"]},
+        "response": [[34200000, 187.5, 20240102], [57600000, 187.25, 20240103]],
+    }
+    client = ThetaDataBase(add_timestamp=True, downcast=downcast)
+    df = client._process_response(response, False, "quotes", "AAPL")
+
+    assert df["timestamp"].tolist() == [
+        pd.Timestamp("2024-01-02 09:30:00"),
+        pd.Timestamp("2024-01-03 16:00:00"),
+    ]
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False])
+def test_write_csv_round_trip(tmp_path, monkeypatch, use_pyarrow):
+    if not use_pyarrow:
+        monkeypatch.setattr("src.base.pa", None)
+    client = ThetaDataBase(log_level="WARNING", output_dir=str(tmp_path))
+    df = pd.DataFrame(
+        [[34200000, 1.5, "C", 20240101], [34200001, 2.25, "P", 20240102]],
+        columns=["ms_of_day", "bid", "right", "date"],
+    )
+    client._write_csv(df, "quotes", "AAPL")
+
+    result = pd.read_csv(tmp_path / "quotes_AAPL.csv")
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    "use_pyarrow, expected",
+    [
+        (
+            True,
+            '"root","ok","bid","ask","timestamp"\n'
+            '"AAPL",true,1.5,2,2024-01-02 09:30:00.123000\n',
+        ),
+        (
+            False,
+            "root,ok,bid,ask,timestamp\n" "AAPL,True,1.5,2.0,2024-01-02 09:30:00.123\n",
+        ),
+    ],
+)
+def test_write_csv_format(tmp_path, monkeypatch, use_pyarrow, expected):
+    if not use_pyarrow:
+        monkeypatch.setattr("src.base.pa", None)
+    client = ThetaDataBase(output_dir=str(tmp_path))
+    df = pd.DataFrame(
+        {
+            "root": ["AAPL"],
+            "ok": [True],
+            "bid": [1.5],
+            "ask": [2.0],
+            "timestamp": [pd.Timestamp("2024-01-02 09:30:00.123")],
+        }
+    )
+    client._write_csv(df, "quotes", "AAPL")
+
+    assert (tmp_path / "quotes_AAPL.csv").read_text() == expected
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False])
+def test_write_csv_gzip(tmp_path, monkeypatch, use_pyarrow):
+    if not use_pyarrow:
+        monkeypatch.setattr("src.base.pa", None)
+    client = ThetaDataBase(output_dir=str(tmp_path), csv_compression="gzip")
+    df = pd.DataFrame({"ms_of_day": [34200000, 34200001], "bid": [1.5, 2.25]})
+    client._write_csv(df, "quotes", "AAPL")
+
+    result = pd.read_csv(tmp_path / "quotes_AAPL.csv.gz")
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_write_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    client = ThetaDataBase(
+        log_level="WARNING", output_dir=str(tmp_path), output_format="parquet"
+    )
+    response = {
+        "header": {"format": ["ms_of_day", "bid", "date"]},
+        "response": [[34200000, 1.5, 20240101], [34200001, 2.25, 20240102]],
+    }
+    df = client._process_response(response, True, "quotes", "AAPL")
+
+    result = pd.read_parquet(tmp_path / "quotes_AAPL.parquet")
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_background_writes_flush(tmp_path):
+    client = ThetaDataBase(output_dir=str(tmp_path), background_writes=True)
+    response = {
+        "header": {"format": ["ms_of_day", "bid"]},
+        "response": [[34200000, 1.5], [34200001, 2.25]],
+    }
+    with patch.object(client, "_write_csv", wraps=client._write_csv) as mock_write:
+        df = client._process_response(response, True, "quotes", "AAPL")
+        client.flush()
+
+    mock_write.assert_called_once()
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "quotes_AAPL.csv"), df)
+
+
+def test_close_stops_background_writer(tmp_path):
+    with ThetaDataBase(output_dir=str(tmp_path), background_writes=True) as client:
+        writer = client._writer
+        client._process_response(
+            {"header": {"format": ["bid"]}, "response": [[1.5]]},
+            True,
+            "quotes",
+            "AAPL",
+        )
+        assert client in _background_clients
+
+    assert not writer.is_alive()
+    assert (tmp_path / "quotes_AAPL.csv").exists()
+    assert client not in _background_clients
+    client.close()  # closing again is harmless
+
+
+def test_unclosed_background_client_collected(tmp_path):
+    client = ThetaDataBase(output_dir=str(tmp_path), background_writes=True)
+    writer = client._writer
+    ref = weakref.ref(client)
+    del client
+    gc.collect()
+
+    assert ref() is None
+    writer.join(timeout=5)
+    assert not writer.is_alive()
+
+
+def test_output_dir_created_when_set(tmp_path):
+    client = ThetaDataBase(output_dir=str(tmp_path / "data"))
+    assert (tmp_path / "data").is_dir()
+
+    client.output_dir = str(tmp_path / "more" / "data")
+    assert (tmp_path / "more" / "data").is_dir()
+
+
+def test_log_level_only_set_when_given():
+    logger = logging.getLogger("src.base")
+    logger.setLevel(logging.ERROR)  # as configured by the application
+    try:
+        ThetaDataBase()
+        assert logger.level == logging.ERROR
+
+        ThetaDataBase(log_level="debug")
+        assert logger.level == logging.DEBUG
+        assert logger.handlers == []  # output is left to the application
+    finally:
+        logger.setLevel(logging.NOTSET)
+
+
+def test_invalid_output_format():
+    with pytest.raises(ValueError):
+        ThetaDataBase(output_format="xlsx")
+
+
+def test_zstd_requires_pyarrow_or_zstandard(monkeypatch):
+    monkeypatch.setattr("src.base.pa", None)
+    with patch("importlib.util.find_spec", return_value=None):
+        with pytest.raises(ValueError):
+            ThetaDataBase(csv_compression="zstd")
+        ThetaDataBase(csv_compression="gzip")
+
+
+def test_parquet_requires_pyarrow(monkeypatch):
+    monkeypatch.setattr("src.base.pa", None)
+    with pytest.raises(ValueError):
+        ThetaDataBase(output_format="parquet")
+
+    client = ThetaDataBase()
+    with pytest.raises(ValueError):
+        client.output_format = "parquet"
+    assert client.output_format == "csv"
+
+
+@pytest.mark.parametrize("chunk_rows", [250_000, 7])
+def test_write_csv_parallel_matches_serial(tmp_path, monkeypatch, chunk_rows):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr("src.base.PARALLEL_CSV_ROWS", 10)
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    client = ThetaDataBase(log_level="WARNING", output_dir=str(tmp_path))
+    client.csv_chunk_rows = chunk_rows
+    df = pd.DataFrame({"ms_of_day": range(103), "bid": [x / 4 for x in range(103)]})
+    client._write_csv(df, "quotes", "AAPL")
+
+    result = pd.read_csv(tmp_path / "quotes_AAPL.csv")
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+
+
+def test_shared_session():
+    session = requests.Session()
+    first = ThetaDataBase(session=session)
+    second = ThetaDataBase(session=session)
+
+    assert first.session is second.session is session
+
+
+def test_send_many_respects_max_concurrency():
+    client = ThetaDataBase(max_concurrency=2)
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_get(url, params, timeout):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return Mock(content=b"{}")
+
+    with patch("requests.Session.get", side_effect=slow_get):
+        client.send_many([("/v2/hist/stock/eod", {"root": str(i)}) for i in range(8)])
+
+    assert peak == 2
+
+
+def test_close_leaves_shared_session_open():
+    session = requests.Session()
+    with patch.object(session, "close") as mock_close:
+        with ThetaDataBase(session=session):
+            pass
+    mock_close.assert_not_called()
+
+    client = ThetaDataBase()
+    with patch.object(client.session, "close") as mock_close:
+        with client:
+            pass
+    mock_close.assert_called_once()
+
+
+def test_send_many_preserves_order():
+    client = ThetaDataBase()
+    calls = [
+        ("/v2/hist/stock/eod", {"root": root}) for root in ("AAPL", "MSFT", "NVDA")
+    ]
+    with patch("requests.Session.get") as mock_get:
+        mock_get.side_effect = lambda url, params, timeout: Mock(
+            content=json.dumps({"root": params["root"]}).encode()
+        )
+        results = client.send_many(calls)
+
+    assert results == [{"root": "AAPL"}, {"root": "MSFT"}, {"root": "NVDA"}]
+    assert mock_get.call_count == 3
+
+
+def test_send_prepared_round_trip():
+    client = ThetaDataBase()
+    url = client.prepare(
+        "/v2/hist/option/quote", {"root": "AAPL", "strike": 190000, "right": "C"}
+    )
+    assert url == f"{BASE_URL}/v2/hist/option/quote?root=AAPL&strike=190000&right=C"
+
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.content = json.dumps({"response": []}).encode()
+        results = client.send_many([url, ("/v2/hist/stock/eod", {"root": "AAPL"})])
+
+    assert results == [{"response": []}, {"response": []}]
+    assert (url,) in [call.args for call in mock_get.call_args_list]
+
+
+def test_send_request_timeout():
+    client = ThetaDataBase(timeout=5)
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.content = b"{}"
+        client.send_request("/v2/hist/stock/eod", {"root": "AAPL"})
+        mock_get.side_effect = requests.Timeout("read timed out")
+        result = client.send_request("/v2/hist/stock/eod", {"root": "AAPL"})
+
+    assert mock_get.call_args_list[0].kwargs["timeout"] == 5
+    assert result is None
+
+
+def test_pool_maxsize():
+    adapter = ThetaDataBase(pool_maxsize=32).session.get_adapter(BASE_URL)
+
+    assert adapter._pool_maxsize == 32
+
+
+def test_base_url_override():
+    class RemoteClient(ThetaDataBase):
+        base_url = "http://10.0.0.5:25510"
+
+    client = RemoteClient()
+
+    assert (
+        client.prepare("/v2/list/roots", {}) == "http://10.0.0.5:25510/v2/list/roots?"
+    )
+    assert client.session.get_adapter(client.base_url).max_retries is RETRY
+
+
+def test_own_session_retries_transient_errors():
+    adapter = ThetaDataBase().session.get_adapter(BASE_URL)
+
+    assert adapter.max_retries is RETRY
+    assert 429 in RETRY.status_forcelist
+    assert RETRY.backoff_jitter > 0
+
+
+def test_read_timeout_not_retried():
+    error = ReadTimeoutError(None, "/v2/hist/option/quote", "Read timed out.")
+
+    with pytest.raises(MaxRetryError):
+        RETRY.increment(method="GET", url="/v2/hist/option/quote", error=error)
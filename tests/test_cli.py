@@ -0,0 +1,141 @@
+import pytest
+from unittest.mock import patch
+from typer.testing import CliRunner
+from cli import thetadata_cli
+from cli.thetadata_cli import COMMANDS, app
+
+runner = CliRunner()
+
+# Command path of each sub-app
+APP_PATHS = {
+    id(thetadata_cli.app): [],
+    id(thetadata_cli.historical_app): ["stocks", "historical"],
+    id(thetadata_cli.snapshot_app): ["stocks", "snapshot"],
+    id(thetadata_cli.options_app): ["options"],
+    id(thetadata_cli.options_historical_app): ["options", "historical"],
+    id(thetadata_cli.options_bulk_app): ["options", "bulk"],
+    id(thetadata_cli.options_snapshot_app): ["options", "snapshot"],
+}
+
+# Command line value and the value the client method receives, per argument
+ARGUMENT_VALUES = {
+    "symbol": (["AAPL"], "AAPL"),
+    "symbols": (["msft", "AAPL", "MSFT"], ("AAPL", "MSFT")),
+    "root": (["AAPL"], "AAPL"),
+    "exp": (["20240119"], "20240119"),
+    "strike": (["170000"], 170000),
+    "right": (["C"], "C"),
+    "start_date": (["20240101"], "20240101"),
+    "end_date": (["20240131"], "20240131"),
+}
+
+
+def patch_method(client, method_name, **kwargs):
+    return patch.object(type(client()), method_name, **kwargs)
+
+
+def test_all_commands_registered():
+    assert len(COMMANDS) == 22
+
+
+@pytest.mark.parametrize(
+    "command_app, name, client, method_name, arguments, options",
+    [command[:6] for command in COMMANDS],
+    ids=[f"{command[3]}-{command[1]}" for command in COMMANDS],
+)
+def test_command_forwards_arguments(
+    command_app, name, client, method_name, arguments, options
+):
+    args = APP_PATHS[id(command_app)] + [name]
+    expected = {}
+    for argument, _ in arguments:
+        cli_values, expected[argument] = ARGUMENT_VALUES[argument]
+        args += cli_values
+    expected.update((option, default) for option, _, default in options)
+
+    with patch_method(client, method_name, return_value=object()) as mock_method:
+        result = runner.invoke(app, args)
+
+    assert result.exit_code == 0, result.output
+    mock_method.assert_called_once_with(**expected, write_csv=True)
+
+
+def test_command_fails_without_data():
+    client = thetadata_cli._historical
+    with patch_method(client, "get_eod_report", return_value=None):
+        result = runner.invoke(
+            app, ["stocks", "historical", "eod-report", "AAPL", "20240101", "20240131"]
+        )
+
+    assert result.exit_code == 1
+    assert "Failed to retrieve data" in result.output
+
+
+@pytest.mark.parametrize("date", ["2024-01-01", "202401", "2024010a"])
+def test_command_rejects_malformed_dates(date):
+    client = thetadata_cli._historical
+    with patch_method(client, "get_eod_report") as mock_method:
+        result = runner.invoke(
+            app, ["stocks", "historical", "eod-report", "AAPL", date, "20240131"]
+        )
+
+    assert result.exit_code == 2
+    assert "YYYYMMDD" in result.output
+    mock_method.assert_not_called()
+
+
+def test_no_cache_option():
+    client = thetadata_cli._historical
+    args = ["stocks", "historical", "eod-report", "AAPL", "20240101", "20240131"]
+    with patch_method(client, "get_eod_report", return_value=object()):
+        runner.invoke(app, ["--no-cache", *args])
+        assert client().cache_dir is None
+
+        runner.invoke(app, args)
+        assert client().cache_dir is not None
+
+
+def test_batch(tmp_path):
+    pytest.importorskip("pyarrow")
+    client = thetadata_cli._historical
+    formats = {}
+
+    def get_eod_report(symbol, start_date, end_date, write_csv):
+        formats[symbol] = client().output_format
+        return None if symbol == "FAIL" else object()
+
+    commands = tmp_path / "commands.txt"
+    commands.write_text(
+        "# daily reports\n"
+        "stocks historical eod-report AAPL 20240101 20240131\n"
+        "\n"
+        "stocks historical eod-report FAIL 20240101 20240131\n"
+        "stocks historical eod-report BAD 2024-01-01 20240131\n"
+        "--format csv stocks historical eod-report MSFT 20240101 20240131\n"
+    )
+    with patch_method(client, "get_eod_report", side_effect=get_eod_report):
+        result = runner.invoke(app, ["--format", "parquet", "batch", str(commands)])
+
+    assert result.exit_code == 1
+    assert "2 command(s) failed" in result.output
+    assert formats == {"AAPL": "parquet", "FAIL": "parquet", "MSFT": "csv"}
+
+
+def test_batch_continues_after_errors(tmp_path):
+    client = thetadata_cli._options
+    commands = tmp_path / "commands.txt"
+    commands.write_text(
+        "options historical quotes AAPL 20240119 170000 X 20240101 20240131\n"
+        "--no-cache batch other.txt\n"
+        "options historical quotes AAPL 20240119 170000 C 20240101 20240131\n"
+    )
+    with patch_method(
+        client, "get_historical_quotes", side_effect=[ValueError("bad right"), object()]
+    ) as mock_method:
+        result = runner.invoke(app, ["batch", str(commands)])
+
+    assert result.exit_code == 1
+    assert "line 1: bad right" in result.output
+    assert "line 2: batch cannot be nested" in result.output
+    assert "2 command(s) failed" in result.output
+    assert mock_method.call_count == 2
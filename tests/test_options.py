@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import patch
 from src.options import ThetaDataOptions
@@ -10,6 +11,27 @@ def options_data():
     return ThetaDataOptions(log_level="WARNING", output_dir="./")
 
 
+@pytest.fixture
+def respond_with(options_data):
+    """
+    Patch options_data.send_request to answer each request with one row.
+
+    row is called with the request params and returns the row's values, or None
+    for a failed request.
+    """
+
+    def patch_send_request(columns, row):
+        def send_request(endpoint, params):
+            values = row(params)
+            if values is None:
+                return None
+            return {"header": {"format": columns}, "response": [values]}
+
+        return patch.object(options_data, "send_request", side_effect=send_request)
+
+    return patch_send_request
+
+
 def test_get_historical_quotes(options_data):
     mock_response = {
         "header": {"format": ["ms_of_day", "bid", "ask", "bidsize", "asksize", "date"]},
@@ -28,6 +50,50 @@ def test_get_historical_quotes(options_data):
     assert list(result.columns) == ["ms_of_day", "bid", "ask", "bidsize", "asksize", "date"]
 
 
+def test_get_historical_quotes_many(options_data, respond_with):
+    def row(params):
+        if params["right"] == "P":
+            return None
+        return [34200000, params["strike"] / 1000, 20240102]
+
+    contracts = [("20240119", 170000, "C"), ("20240119", 170000, "P"), ("20240119", 175000, "C")]
+    with respond_with(["ms_of_day", "bid", "date"], row):
+        result = options_data.get_historical_quotes_many(
+            "AAPL", contracts, "20240101", "20240102"
+        )
+
+    assert list(result.columns) == ["ms_of_day", "bid", "date", "exp", "strike", "right"]
+    assert result["strike"].tolist() == [170000, 175000]
+    assert result["bid"].tolist() == [170.0, 175.0]
+
+
+def test_get_quote_at_time_return_dict(options_data):
+    mock_response = {
+        "header": {"format": ["ms_of_day", "bid", "ask", "date"]},
+        "response": [[34200000, 10.0, 10.1, 20240102]],
+    }
+    with patch.object(ThetaDataOptions, "send_request", return_value=mock_response):
+        result = options_data.get_quote_at_time(
+            "AAPL", "20240119", 170000, "C", "20240102", "20240102", 3600000, return_dict=True
+        )
+
+    assert result == {"ms_of_day": 34200000, "bid": 10.0, "ask": 10.1, "date": 20240102}
+
+
+def test_get_many(options_data, respond_with):
+    calls = [
+        dict(root="AAPL", exp="20240119", strike=strike, right="C", start_date="20240102", end_date="20240102")
+        for strike in (170000, 175000)
+    ]
+    with respond_with(["strike"], lambda params: [params["strike"]]):
+        results = options_data.get_many("get_historical_greeks", calls)
+
+    assert [df["strike"].tolist() for df in results] == [[170000], [175000]]
+    for method in ("send_request", "get_many", "get_historical_quotes_many"):
+        with pytest.raises(ValueError):
+            options_data.get_many(method, calls)
+
+
 def test_get_historical_trades(options_data):
     mock_response = {
         "header": {"format": ["ms_of_day", "price", "size", "exchange", "condition", "date"]},
@@ -118,7 +184,6 @@ def test_get_historical_open_interest(options_data):
     assert list(result.columns) == ["open_interest", "date"]
 
 
-
 def test_get_bulk_quote(options_data):
     mock_response = {
         "header": {"format": ["ms_of_day", "strike", "right", "bid", "ask", "bidsize", "asksize", "date"]},
@@ -137,10 +202,62 @@ def test_get_bulk_quote(options_data):
     assert list(result.columns) == ["ms_of_day", "strike", "right", "bid", "ask", "bidsize", "asksize", "date"]
 
 
+def test_get_bulk_greeks(options_data):
+    with patch.object(ThetaDataOptions, "send_request", return_value=None) as mock_send:
+        options_data.get_bulk_greeks("AAPL", "20240119", "20240102", "20240102", 60000)
+
+    mock_send.assert_called_once_with(
+        "/v2/bulk_hist/option/greeks",
+        {
+            "root": "AAPL",
+            "exp": "20240119",
+            "start_date": "20240102",
+            "end_date": "20240102",
+            "ivl": 60000,
+            "rth": "true",
+            "use_csv": "false",
+        },
+    )
+    with pytest.raises(ValueError):
+        options_data.get_bulk_greeks("AAPL", "20240119", "20240102", "20240102", 0)
+
+
+@pytest.mark.parametrize("rth, expected", [(True, "true"), (False, "false"), ("false", "false"), ("True", "true"), (None, "none")])
+def test_bool_params_spelled_as_before(options_data, rth, expected):
+    with patch.object(ThetaDataOptions, "send_request", return_value=None) as mock_send:
+        options_data.get_bulk_greeks("AAPL", "20240119", "20240102", "20240102", 60000, rth=rth)
+
+    assert mock_send.call_args.args[1]["rth"] == expected
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "get_historical_implied_volatility",
+        "get_historical_greeks",
+        "get_historical_greeks_second_order",
+        "get_historical_greeks_third_order",
+        "get_historical_all_greeks",
+    ],
+)
+def test_right_checked_before_ivl(options_data, method):
+    with pytest.raises(ValueError, match="right"):
+        getattr(options_data, method)("AAPL", "20240119", 170000, "X", "20240101", "20240102", ivl=1)
+
+
+def test_get_bulk_quote_many(options_data, respond_with):
+    pairs = [("AAPL", "20240119"), ("MSFT", "20240119")]
+    with respond_with(["ms_of_day", "bid", "date"], lambda params: [34200000, 1.5, 20240102]) as mock_send:
+        result = options_data.get_bulk_quote_many(pairs, "20240102", "20240102", 60000)
+
+    assert mock_send.call_count == 2
+    assert result[["root", "exp"]].values.tolist() == [["AAPL", "20240119"], ["MSFT", "20240119"]]
+
+
 def test_send_request(options_data):
     mock_response = {"key": "value"}
-    with patch("requests.get") as mock_get:
-        mock_get.return_value.json.return_value = mock_response
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.content = json.dumps(mock_response).encode()
         mock_get.return_value.raise_for_status.return_value = None
         result = options_data.send_request("/test_endpoint", {"param": "value"})
 
@@ -148,7 +265,7 @@ def test_send_request(options_data):
 
 
 def test_send_request_error(options_data):
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.side_effect = requests.RequestException("Test error")
         result = options_data.send_request("/test_endpoint", {"param": "value"})
 
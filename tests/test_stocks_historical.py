@@ -1,3 +1,4 @@
+import json
 import pytest
 import pandas as pd
 import requests
@@ -198,8 +199,8 @@ def test_get_dividends(historical_data):
 
 def test_send_request(historical_data):
     mock_response = {"key": "value"}
-    with patch("requests.get") as mock_get:
-        mock_get.return_value.json.return_value = mock_response
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.content = json.dumps(mock_response).encode()
         mock_get.return_value.raise_for_status.return_value = None
         result = historical_data.send_request("/test_endpoint", {"param": "value"})
 
@@ -207,7 +208,7 @@ def test_send_request(historical_data):
 
 
 def test_send_request_error(historical_data):
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.side_effect = requests.RequestException("Test error")
         result = historical_data.send_request("/test_endpoint", {"param": "value"})
 
@@ -217,5 +218,7 @@ def test_send_request_error(historical_data):
 def test_is_valid_date_format():
     assert not is_valid_date_format("2024-01-01")
     assert not is_valid_date_format("202401")
+    assert not is_valid_date_format("20240101\n")
+    assert not is_valid_date_format("２０２４０１０１")
     assert is_valid_date_format("20240101")
     assert is_valid_date_format("20240132")
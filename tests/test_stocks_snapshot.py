@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import patch
 from src.stocks import ThetaDataStocksSnapshot
@@ -332,8 +333,8 @@ def test_get_trades(snapshot_data):
 
 def test_send_request(snapshot_data):
     mock_response = {"key": "value"}
-    with patch("requests.get") as mock_get:
-        mock_get.return_value.json.return_value = mock_response
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.content = json.dumps(mock_response).encode()
         mock_get.return_value.raise_for_status.return_value = None
         result = snapshot_data.send_request("/test_endpoint", {"param": "value"})
 
@@ -341,7 +342,7 @@ def test_send_request(snapshot_data):
 
 
 def test_send_request_error(snapshot_data):
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.side_effect = requests.RequestException("Test error")
         result = snapshot_data.send_request("/test_endpoint", {"param": "value"})
 